@@ -1,6 +1,17 @@
+import os
+import zlib
 import numpy as np
 import sys
 
+# Outputs depend only on this script, so GoldenModelManager may reuse cached results
+DETERMINISTIC = True
+
+# Shared helpers live in the parent directory (data/input/golden_common.py)
+_INPUT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _INPUT_DIR not in sys.path:
+    sys.path.insert(0, _INPUT_DIR)
+from golden_common import write_memory_image
+
 def conv2d_numpy(input_tensor, weight, bias=None, stride=1, padding=1):
     """
     NumPy implementation of 2D convolution
@@ -33,26 +44,18 @@ def conv2d_numpy(input_tensor, weight, bias=None, stride=1, padding=1):
     # Initialize output
     output = np.zeros((K, H_out, W_out), dtype=np.float32)
     
-    # Perform convolution
+    # im2col: every output position's (C, I, J) patch, laid out contiguously as
+    # (H_out, W_out, C, I, J) so each patch is summed exactly like a single patch
+    windows = np.lib.stride_tricks.sliding_window_view(padded_input, (I, J), axis=(1, 2))
+    patches = np.ascontiguousarray(windows[:, ::stride, ::stride].transpose(1, 2, 0, 3, 4))
+    
+    # Perform convolution, one output channel at a time
     for k in range(K):
-        for h in range(H_out):
-            for w in range(W_out):
-                h_start = h * stride
-                h_end = h_start + I
-                w_start = w * stride
-                w_end = w_start + J
-                
-                # Extract patch
-                patch = padded_input[:, h_start:h_end, w_start:w_end]
-                
-                # Compute convolution for this output position
-                conv_result = np.sum(patch * weight[k])
-                
-                # Add bias if provided
-                if bias is not None:
-                    conv_result += bias[k]
-                
-                output[k, h, w] = conv_result
+        output[k] = np.sum(patches * weight[k], axis=(2, 3, 4))
+        
+        # Add bias if provided
+        if bias is not None:
+            output[k] += bias[k]
     
     return output
 
@@ -60,7 +63,7 @@ def relu_numpy(x):
     """NumPy implementation of ReLU activation"""
     return np.maximum(0, x)
 
-def conv(memdata_filename, golden_filename):
+def conv(memdata_filename, golden_filename, binary=False):
     # Parameters
     K = 32  # output channels
     C = 32  # input channels
@@ -84,8 +87,10 @@ def conv(memdata_filename, golden_filename):
     # w = np.random.randn(K, C, I, J).astype(np.float32)              # KCIJ
     # b = np.random.randn(K).astype(np.float32) if Has_bias else None
 
-    x = np.random.randn(1, C, H, W).astype(np.float32)              # NCHW
-    w = np.random.randn(K, C, I, J).astype(np.float32)              # KCIJ
+    # Seed from the parameters so every run regenerates the same data
+    rng = np.random.RandomState(zlib.crc32(repr((K, C, H, W, I, J, Stride, Has_bias)).encode()))
+    x = rng.randn(1, C, H, W).astype(np.float32)              # NCHW
+    w = rng.randn(K, C, I, J).astype(np.float32)              # KCIJ
     b = np.ones(K, dtype=np.float32) if Has_bias else None
 
 
@@ -101,14 +106,14 @@ def conv(memdata_filename, golden_filename):
     # y is already CHW from conv2d_numpy
 
     # Layout reshaping (explicitly match layout):
-    x_flat = x.transpose(0, 1, 2).reshape(-1)     # CHW
-    w_flat = w.transpose(0, 1, 2, 3).reshape(-1)  # KCIJ
-    y_flat = y.transpose(0, 1, 2).reshape(-1)     # KHW
+    x_flat = x.ravel()     # CHW
+    w_flat = w.ravel()     # KCIJ
+    y_flat = y.ravel()     # KHW
 
     if Has_bias:
         # Bias is broadcast to shape of output (K x H_out x W_out)
         b_reshaped = b[:, None, None] * np.ones((K, y.shape[1], y.shape[2]))  # K x H x W
-        b_flat = b_reshaped.reshape(-1)
+        b_flat = b_reshaped.ravel()
     else:
         b_flat = None
 
@@ -127,38 +132,21 @@ def conv(memdata_filename, golden_filename):
     print(f"Output  [{Output_addr} - {Output_addr + len(y_flat) - 1}]")
 
     # === Write to memdata ===
-    with open(memdata_filename, "w") as f:
-        for addr in range(max_address):
-            if Input_addr <= addr < Input_addr + len(x_flat):
-                value = x_flat[addr - Input_addr]
-            elif Weight_addr <= addr < Weight_addr + len(w_flat):
-                value = w_flat[addr - Weight_addr]
-            elif Has_bias and Bias_addr <= addr < Bias_addr + len(b_flat):
-                value = b_flat[addr - Bias_addr]
-            else:
-                value = 0.0
-            f.write(f"{value:.7f}\n")
+    # Later regions win where they overlap, mirroring the if/elif priority
+    regions = [("bias", Bias_addr, b_flat)] if Has_bias else []
+    regions += [("weight", Weight_addr, w_flat), ("input", Input_addr, x_flat)]
+    write_memory_image(memdata_filename, regions, max_address, binary=binary)
 
     # === Write to golden ===
-    with open(golden_filename, "w") as f:
-        for addr in range(max_address):
-            if Output_addr <= addr < Output_addr + len(y_flat):
-                value = y_flat[addr - Output_addr]
-            elif Input_addr <= addr < Input_addr + len(x_flat):
-                value = x_flat[addr - Input_addr]
-            elif Weight_addr <= addr < Weight_addr + len(w_flat):
-                value = w_flat[addr - Weight_addr]
-            elif Has_bias and Bias_addr <= addr < Bias_addr + len(b_flat):
-                value = b_flat[addr - Bias_addr]
-            else:
-                value = 0.0
-            f.write(f"{value:.7f}\n")
+    write_memory_image(golden_filename, regions + [("output", Output_addr, y_flat)], max_address, binary=binary)
 
 if __name__ == "__main__":
-    if len(sys.argv) != 3:
-        print("Usage: python conv_golden.py memdata.txt golden.txt")
+    binary = "--binary" in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != "--binary"]
+    if len(args) != 2:
+        print("Usage: python conv_golden.py memdata.txt golden.txt [--binary]")
         sys.exit(1)
 
-    mem_file = sys.argv[1]
-    golden_file = sys.argv[2]
-    conv(mem_file, golden_file)
+    mem_file = args[0]
+    golden_file = args[1]
+    conv(mem_file, golden_file, binary=binary)
@@ -1,3 +1,4 @@
+import os
 import numpy as np
 import sys
 from itertools import islice
@@ -5,6 +6,15 @@ from itertools import islice
 # This script models FFT computation based on CGRA architecture
 # and compares the error with numpy's FFT calculation.
 
+# Outputs depend only on this script, so GoldenModelManager may reuse cached results
+DETERMINISTIC = True
+
+# Shared helpers live in the parent directory (data/input/golden_common.py)
+_INPUT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _INPUT_DIR not in sys.path:
+    sys.path.insert(0, _INPUT_DIR)
+from golden_common import write_memory_image
+
 def bit_reverse(n, bits):
     reversed_n = 0
     for i in range(bits):
@@ -15,7 +25,7 @@ def bit_reverse(n, bits):
 def calculate_magnitudes(complex_list):
     return [abs(c) for c in complex_list]
 
-def fft(memdata_filename, golden_filename):
+def fft(memdata_filename, golden_filename, binary=False):
     # Parameters
     N = 1024  # sequence length
     freq = [100, 200, 300, 400, 500, 600, 700, 800, 900, 1000]  # frequencies in Hz
@@ -71,30 +81,22 @@ def fft(memdata_filename, golden_filename):
     max_address = 40000
 
     # write to specified file with input and weights stored at specific addresses
-    with open(memdata_filename, "w") as f:
-        for address in range(max_address):
-            if 10240 <= address < 10240 + len(input_ri):
-                value = input_ri[address - 10240]
-            elif 20480 <= address < 20480 + len(w_c_rev_ri):
-                value = w_c_rev_ri[address - 20480]
-            else:
-                value = 0
-            f.write(f"{value:.7f}\n")
-            
-    with open(golden_filename, "w") as f:
-        for address in range(max_address):
-            if 10240 <= address < 10240 + len(input_ri):
-                value = input_ri[address - 10240]
-            elif 20480 <= address < 20480 + len(w_c_rev_ri):
-                value = w_c_rev_ri[address - 20480]
-            elif 0<=address<0+len(output_ri):
-                assert len(output_ri) < 10240, "Address exceeds output size"
-                value = output_ri[address]
-            else:
-                value = 0.0
-            f.write(f"{value:.7f}\n")
+    # Later regions win where they overlap, mirroring the if/elif priority;
+    # float64 keeps the values identical to formatting the Python floats directly
+    regions = [("twiddle", 20480, w_c_rev_ri), ("input", 10240, input_ri)]
+    write_memory_image(memdata_filename, regions, max_address, dtype=np.float64, binary=binary)
+
+    assert len(output_ri) < 10240, "Address exceeds output size"
+    write_memory_image(golden_filename, [("output", 0, output_ri)] + regions, max_address,
+                       dtype=np.float64, binary=binary)
 
 if __name__ == "__main__":
-    mem_file = sys.argv[1]
-    golden_file = sys.argv[2]
-    fft(mem_file, golden_file)
+    binary = "--binary" in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != "--binary"]
+    if len(args) != 2:
+        print("Usage: python fft_golden.py mem_output.txt golden_output.txt [--binary]")
+        sys.exit(1)
+
+    mem_file = args[0]
+    golden_file = args[1]
+    fft(mem_file, golden_file, binary=binary)
@@ -1,7 +1,18 @@
+import os
+import zlib
 import numpy as np
 import sys
 
-def gemm(memdata_filename, golden_filename):
+# Outputs depend only on this script, so GoldenModelManager may reuse cached results
+DETERMINISTIC = True
+
+# Shared helpers live in the parent directory (data/input/golden_common.py)
+_INPUT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _INPUT_DIR not in sys.path:
+    sys.path.insert(0, _INPUT_DIR)
+from golden_common import write_memory_image
+
+def gemm(memdata_filename, golden_filename, binary=False):
     """
     Generates input matrices for GEMM, writes them to memory layout,
     computes the golden output (M x K @ K x N), and writes both to files.
@@ -16,8 +27,10 @@ def gemm(memdata_filename, golden_filename):
     ADDR_MN = 0
 
     # Generate input matrices
-    A = np.random.rand(M, K).astype(np.float32)  # MK
-    B = np.random.rand(K, N).astype(np.float32)  # KN
+    # Seed from the parameters so every run regenerates the same data
+    rng = np.random.RandomState(zlib.crc32(repr((M, N, K)).encode()))
+    A = rng.rand(M, K).astype(np.float32)  # MK
+    B = rng.rand(K, N).astype(np.float32)  # KN
     C = A @ B  # MN result
 
     print("Matrix A (M x K):")
@@ -28,42 +41,28 @@ def gemm(memdata_filename, golden_filename):
     print(C)
 
     # Flatten all matrices row-major
-    A_flat = A.flatten()
-    B_flat = B.flatten()
-    C_flat = C.flatten()
+    A_flat = A.ravel()
+    B_flat = B.ravel()
+    C_flat = C.ravel()
 
     max_address = 40000
 
     # Write memory layout to memdata file
-    with open(memdata_filename, "w") as f:
-        for addr in range(max_address):
-            if ADDR_MK <= addr < ADDR_MK + len(A_flat):
-                value = A_flat[addr - ADDR_MK]
-            elif ADDR_KN <= addr < ADDR_KN + len(B_flat):
-                value = B_flat[addr - ADDR_KN]
-            else:
-                value = 0.0
-            f.write(f"{value:.7f}\n")
+    # Later regions win where they overlap, mirroring the if/elif priority
+    regions = [("B", ADDR_KN, B_flat), ("A", ADDR_MK, A_flat)]
+    write_memory_image(memdata_filename, regions, max_address, binary=binary)
 
     # Write full memory snapshot to golden file including result
-    with open(golden_filename, "w") as f:
-        for addr in range(max_address):
-            if ADDR_MN <= addr < ADDR_MN + len(C_flat):
-                value = C_flat[addr - ADDR_MN]
-            elif ADDR_MK <= addr < ADDR_MK + len(A_flat):
-                value = A_flat[addr - ADDR_MK]
-            elif ADDR_KN <= addr < ADDR_KN + len(B_flat):
-                value = B_flat[addr - ADDR_KN]
-            else:
-                value = 0.0
-            f.write(f"{value:.7f}\n")
+    write_memory_image(golden_filename, regions + [("C", ADDR_MN, C_flat)], max_address, binary=binary)
 
 if __name__ == "__main__":
-    if len(sys.argv) != 3:
-        print("Usage: python gemm_golden.py mem_output.txt golden_output.txt")
+    binary = "--binary" in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != "--binary"]
+    if len(args) != 2:
+        print("Usage: python gemm_golden.py mem_output.txt golden_output.txt [--binary]")
         sys.exit(1)
 
-    mem_file = sys.argv[1]
-    golden_file = sys.argv[2]
+    mem_file = args[0]
+    golden_file = args[1]
 
-    gemm(mem_file, golden_file)
+    gemm(mem_file, golden_file, binary=binary)
@@ -1,7 +1,18 @@
+import os
+import zlib
 import numpy as np
 import sys
 
-def gemm(memdata_filename, golden_filename):
+# Outputs depend only on this script, so GoldenModelManager may reuse cached results
+DETERMINISTIC = True
+
+# Shared helpers live in the parent directory (data/input/golden_common.py)
+_INPUT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _INPUT_DIR not in sys.path:
+    sys.path.insert(0, _INPUT_DIR)
+from golden_common import write_memory_image
+
+def gemm(memdata_filename, golden_filename, binary=False):
     """
     Generates input matrices for large GEMM, writes them to memory layout,
     computes the golden output (M x K @ K x N), and writes both to files.
@@ -30,8 +41,10 @@ def gemm(memdata_filename, golden_filename):
     print(f"  B input starts at address {ADDR_KN}, size {size_B} floats")
 
     # Generate input matrices
-    A = np.random.rand(M, K).astype(np.float32)
-    B = np.random.rand(K, N).astype(np.float32)
+    # Seed from the parameters so every run regenerates the same data
+    rng = np.random.RandomState(zlib.crc32(repr((M, N, K)).encode()))
+    A = rng.rand(M, K).astype(np.float32)
+    B = rng.rand(K, N).astype(np.float32)
     C = A @ B  # Matrix multiply result
 
     print("Matrix A (M x K): shape =", A.shape)
@@ -39,9 +52,9 @@ def gemm(memdata_filename, golden_filename):
     print("Matrix C = A @ B (M x N): shape =", C.shape)
 
     # Flatten for memory
-    A_flat = A.flatten()
-    B_flat = B.flatten()
-    C_flat = C.flatten()
+    A_flat = A.ravel()
+    B_flat = B.ravel()
+    C_flat = C.ravel()
 
     # === Print per-slice info (formatted like conv) ===
     print(f"\n[Per-slice info (base {SLICE_M} rows per slice)]")
@@ -62,35 +75,21 @@ def gemm(memdata_filename, golden_filename):
     max_address = ADDR_KN + size_B + 1024  # Safety buffer
 
     # === Write memdata file ===
-    with open(memdata_filename, "w") as f:
-        for addr in range(max_address):
-            if ADDR_MK <= addr < ADDR_MK + size_A:
-                value = A_flat[addr - ADDR_MK]
-            elif ADDR_KN <= addr < ADDR_KN + size_B:
-                value = B_flat[addr - ADDR_KN]
-            else:
-                value = 0.0
-            f.write(f"{value:.7f}\n")
+    # Later regions win where they overlap, mirroring the if/elif priority
+    regions = [("B", ADDR_KN, B_flat), ("A", ADDR_MK, A_flat)]
+    write_memory_image(memdata_filename, regions, max_address, binary=binary)
 
     # === Write golden file (C, A, B) ===
-    with open(golden_filename, "w") as f:
-        for addr in range(max_address):
-            if ADDR_MN <= addr < ADDR_MN + size_C:
-                value = C_flat[addr - ADDR_MN]
-            elif ADDR_MK <= addr < ADDR_MK + size_A:
-                value = A_flat[addr - ADDR_MK]
-            elif ADDR_KN <= addr < ADDR_KN + size_B:
-                value = B_flat[addr - ADDR_KN]
-            else:
-                value = 0.0
-            f.write(f"{value:.7f}\n")
+    write_memory_image(golden_filename, regions + [("C", ADDR_MN, C_flat)], max_address, binary=binary)
 
 if __name__ == "__main__":
-    if len(sys.argv) != 3:
-        print("Usage: python gemm_golden.py mem_output.txt golden_output.txt")
+    binary = "--binary" in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != "--binary"]
+    if len(args) != 2:
+        print("Usage: python gemm_golden.py mem_output.txt golden_output.txt [--binary]")
         sys.exit(1)
 
-    mem_file = sys.argv[1]
-    golden_file = sys.argv[2]
+    mem_file = args[0]
+    golden_file = args[1]
 
-    gemm(mem_file, golden_file)
+    gemm(mem_file, golden_file, binary=binary)
@@ -0,0 +1,39 @@
+"""
+Shared helpers for the golden model scripts in the task directories.
+Each golden.py puts this directory on sys.path and imports from here.
+"""
+
+import json
+import numpy as np
+
+
+def write_memory_image(filename, regions, max_address, fmt="%.7f", dtype=np.float32, binary=False):
+    """
+    Lay the regions out in a zero-filled memory image and write it, one formatted word per line.
+    With binary=True the raw little-endian words are written instead, plus a
+    <filename>.json sidecar recording dtype, length and the address regions.
+
+    :param filename: Output file path
+    :param regions: (name, address, values) tuples; later regions win where they overlap
+    :param max_address: Number of words in the image
+    :param fmt: printf-style format of one word in the text output
+    :param dtype: Word type of the image
+    :param binary: Write raw binary words instead of text
+    """
+    mem = np.zeros(max_address, dtype=dtype)
+    for _, address, values in regions:
+        mem[address:address + len(values)] = values
+
+    if binary:
+        words = mem.astype(mem.dtype.newbyteorder('<'))
+        words.tofile(filename)
+        layout = {name: [address, len(values)] for name, address, values in regions}
+        with open(filename + ".json", "w") as f:
+            json.dump({"dtype": words.dtype.str, "length": int(words.size),
+                       "regions": layout}, f, indent=2)
+    else:
+        # tofile formats in C; the output matches np.savetxt (one value per line)
+        with open(filename, "w", buffering=1 << 20) as f:
+            if mem.size:
+                mem.tofile(f, sep="\n", format=fmt)
+                f.write("\n")
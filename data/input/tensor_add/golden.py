@@ -1,7 +1,18 @@
+import os
+import zlib
 import numpy as np
 import sys
 
-def vector_add(memdata_filename, golden_filename):
+# Outputs depend only on this script, so GoldenModelManager may reuse cached results
+DETERMINISTIC = True
+
+# Shared helpers live in the parent directory (data/input/golden_common.py)
+_INPUT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _INPUT_DIR not in sys.path:
+    sys.path.insert(0, _INPUT_DIR)
+from golden_common import write_memory_image
+
+def vector_add(memdata_filename, golden_filename, binary=False):
     """
     Performs vector addition A + B = C with 256 float32 values.
     Stores memory layout according to LSU configuration.
@@ -16,8 +27,10 @@ def vector_add(memdata_filename, golden_filename):
     MAX_ADDR = 4000  # Large enough to contain all three regions
 
     # Generate two random vectors
-    A = np.random.rand(VECTOR_LEN).astype(np.float32)
-    B = np.random.rand(VECTOR_LEN).astype(np.float32)
+    # Seed from the parameters so every run regenerates the same data
+    rng = np.random.RandomState(zlib.crc32(repr((VECTOR_LEN,)).encode()))
+    A = rng.rand(VECTOR_LEN).astype(np.float32)
+    B = rng.rand(VECTOR_LEN).astype(np.float32)
     C = A + B
 
     # Print all 3 vectors
@@ -32,35 +45,21 @@ def vector_add(memdata_filename, golden_filename):
     print_vector(C, "Vector C = A + B")
 
     # Write to memdata file (only A and B)
-    with open(memdata_filename, "w") as f:
-        for addr in range(MAX_ADDR):
-            if ADDR_A <= addr < ADDR_A + VECTOR_LEN:
-                value = A[addr - ADDR_A]
-            elif ADDR_B <= addr < ADDR_B + VECTOR_LEN:
-                value = B[addr - ADDR_B]
-            else:
-                value = 0.0
-            f.write(f"{value:.7f}\n")
+    # Later regions win where they overlap, mirroring the if/elif priority
+    regions = [("B", ADDR_B, B), ("A", ADDR_A, A)]
+    write_memory_image(memdata_filename, regions, MAX_ADDR, binary=binary)
 
     # Write to golden file (includes result C)
-    with open(golden_filename, "w") as f:
-        for addr in range(MAX_ADDR):
-            if ADDR_C <= addr < ADDR_C + VECTOR_LEN:
-                value = C[addr - ADDR_C]
-            elif ADDR_A <= addr < ADDR_A + VECTOR_LEN:
-                value = A[addr - ADDR_A]
-            elif ADDR_B <= addr < ADDR_B + VECTOR_LEN:
-                value = B[addr - ADDR_B]
-            else:
-                value = 0.0
-            f.write(f"{value:.7f}\n")
+    write_memory_image(golden_filename, regions + [("C", ADDR_C, C)], MAX_ADDR, binary=binary)
 
 if __name__ == "__main__":
-    if len(sys.argv) != 3:
-        print("Usage: python vector_add_golden.py mem_output.txt golden_output.txt")
+    binary = "--binary" in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != "--binary"]
+    if len(args) != 2:
+        print("Usage: python vector_add_golden.py mem_output.txt golden_output.txt [--binary]")
         sys.exit(1)
 
-    mem_file = sys.argv[1]
-    golden_file = sys.argv[2]
+    mem_file = args[0]
+    golden_file = args[1]
 
-    vector_add(mem_file, golden_file)
+    vector_add(mem_file, golden_file, binary=binary)
@@ -61,7 +61,7 @@ pyinstaller --name=CGRAPerformanceGUI ^
     --add-data="data;data" ^
     --add-data="bin;bin" ^
     --hidden-import=matplotlib ^
-    --hidden-import=matplotlib.backends.backend_qt5agg ^
+    --hidden-import=matplotlib.backends.backend_qtagg ^
     --hidden-import=numpy ^
     --hidden-import=PIL ^
     --hidden-import=PIL.Image ^
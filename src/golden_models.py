@@ -6,8 +6,21 @@ Centralized management for all golden model implementations to support offline e
 
 import os
 import sys
-import importlib.util
-from typing import Optional, Callable
+import errno
+import shutil
+import hashlib
+import threading
+from typing import Optional, Callable, Iterable, Tuple
+
+
+# Entry point names of the golden models, each called as fn(mem_file, golden_file)
+GOLDEN_ENTRY_POINTS = ("gemm", "conv", "fft", "vector_hadamard", "vector_add", "vector_sub_int", "main")
+
+# Directory (inside each task directory) holding cached outputs of deterministic models
+GOLDEN_CACHE_DIR = ".cache"
+
+# Helper modules in input_dir shared by the golden models; part of every model's cache key
+GOLDEN_SHARED_MODULES = ("golden_common.py",)
 
 
 class GoldenModelManager:
@@ -16,145 +29,430 @@ class GoldenModelManager:
     def __init__(self, data_dir: str):
         self.data_dir = data_dir
         self.input_dir = os.path.join(data_dir, "input")
+        # Prefix and helper paths joined once; per-task paths are then plain string concatenation
+        self._task_prefix = os.path.join(os.fspath(self.input_dir), "")
+        self._golden_suffix = os.sep + "golden.py"
+        self._shared_paths = tuple(os.path.join(self.input_dir, name) for name in GOLDEN_SHARED_MODULES)
+        # golden_path -> directory of the model
+        self._model_dirs = {}
+        # golden_path -> (source stamp, module, entry point); reloaded when the stamp changes
+        self._module_cache = {}
+        self._module_lock = threading.Lock()
+        # (input_dir mtime, model names) of the last list_available_models scan
+        self._models_cache = None
+        # Tasks found by that scan, so validate_model can answer without touching the disk
+        self._valid_tasks = frozenset()
+        # Worker pool kept alive between run_batch calls, with its max_workers
+        self._batch_executor = None
+        self._batch_workers = 0
     
     def run_golden_model(self, task: str, mem_file: str, golden_file: str,
-                        stdout_callback: Optional[Callable[[str], None]] = None):
+                        stdout_callback: Optional[Callable[[str], None]] = None,
+                        binary: bool = False):
         """
         Execute a golden model for the specified task.
         
         :param task: Task name (e.g., "gemm_fp32_slice16")
-        :param mem_file: Memory data file path
-        :param golden_file: Golden output file path
+        :param mem_file: Memory data file path (relative paths are relative to input_dir)
+        :param golden_file: Golden output file path (relative paths are relative to input_dir)
         :param stdout_callback: Optional callback for output messages
+        :param binary: Ask the golden model for raw binary output (--binary) instead of text
         """
-        def output(msg: str):
-            if stdout_callback:
-                stdout_callback(msg)
-            else:
-                print(msg)
+        output = stdout_callback or print
         
         # Construct path to golden model
-        golden_path = os.path.join(self.input_dir, task, "golden.py")
-        
-        if not os.path.exists(golden_path):
-            raise FileNotFoundError(f"Golden model not found: {golden_path}")
+        golden_path = self._golden_path(task)
         
         try:
-            # Load and execute the golden model module
-            spec = importlib.util.spec_from_file_location("golden_model", golden_path)
-            golden_module = importlib.util.module_from_spec(spec)
+            # mem_file and golden_file are relative to input_dir; resolve them once
+            # so the model runs without changing the cwd or sys.argv
+            mem_abs = os.path.abspath(os.path.join(self.input_dir, mem_file))
+            golden_abs = os.path.abspath(os.path.join(self.input_dir, golden_file))
             
-            # Save current working directory and sys.path
-            original_cwd = os.getcwd()
-            original_path = sys.path.copy()
-            original_argv = sys.argv.copy()
+            # Only pass the keyword when requested so models without it keep working
+            extra_kwargs = {"binary": True} if binary else {}
+            
+            # Load (or reuse) the module and call its entry point directly
+            stamp, golden_module, entry_point = self._load_model(task, golden_path)
+            
+            # Deterministic models produce the same files for the same script,
+            # so a previous run's outputs can be copied instead of regenerated
+            deterministic = getattr(golden_module, "DETERMINISTIC", False)
+            cached = self._cached_outputs(golden_path, stamp, binary) if deterministic else None
+            if cached and all(os.path.isfile(src) for src in cached):
+                self._copy_outputs(cached, mem_abs, golden_abs, binary)
+                output(f"Golden model '{task}' reused cached results")
+                return
+            
+            entry_point(mem_abs, golden_abs, **extra_kwargs)
+            if cached:
+                self._store_outputs(cached, mem_abs, golden_abs, binary)
+            
+            output(f"Golden model '{task}' executed successfully")
             
-            try:
-                # Set working directory to the golden model's directory
-                model_dir = os.path.dirname(golden_path)
-                os.chdir(model_dir)
-                
-                # Add model directory to Python path
-                if model_dir not in sys.path:
-                    sys.path.insert(0, model_dir)
-                
-                # Convert file paths to be relative to the model directory
-                # mem_file and golden_file are relative to input_dir, but we're now in model_dir
-                # So we need to go up one level to access files in input_dir
-                mem_file_relative = os.path.join("..", mem_file) if not os.path.isabs(mem_file) else mem_file
-                golden_file_relative = os.path.join("..", golden_file) if not os.path.isabs(golden_file) else golden_file
-                
-                # Set command line arguments
-                sys.argv = ["golden.py", mem_file_relative, golden_file_relative]
-                
-                # Execute the module
-                spec.loader.exec_module(golden_module)
-                
-                # Since __name__ is not "__main__" when using importlib, we need to manually
-                # trigger the main execution logic. Check if the module has the expected functions.
-                if hasattr(golden_module, 'gemm') and len(sys.argv) == 3:
-                    # Call the main function directly since __name__ != "__main__"
-                    golden_module.gemm(sys.argv[1], sys.argv[2])
-                elif hasattr(golden_module, 'conv') and len(sys.argv) == 3:
-                    # For conv models
-                    golden_module.conv(sys.argv[1], sys.argv[2])
-                elif hasattr(golden_module, 'fft') and len(sys.argv) == 3:
-                    # For fft models
-                    golden_module.fft(sys.argv[1], sys.argv[2])
-                else:
-                    # Try to find and call the main function dynamically
-                    # Look for functions that take exactly 2 parameters (mem_file, golden_file)
-                    import inspect
-                    for name, obj in inspect.getmembers(golden_module):
-                        if (inspect.isfunction(obj) and 
-                            len(inspect.signature(obj).parameters) == 2 and
-                            not name.startswith('_')):
-                            obj(sys.argv[1], sys.argv[2])
-                            break
-                    else:
-                        # If no suitable function found, raise an error
-                        raise RuntimeError(f"No suitable main function found in golden model for task '{task}'")
-                
-                # If the module has a main function, call it directly
-                # Otherwise, check if it defines functions we can call
-                if hasattr(golden_module, '__main__') and callable(getattr(golden_module, '__main__')):
-                    golden_module.__main__()
-                elif hasattr(golden_module, 'main') and callable(getattr(golden_module, 'main')):
-                    golden_module.main()
-                else:
-                    # Try to call a function with appropriate name
-                    # Look for functions that match the task pattern
-                    task_name_lower = task.split('_')[0].lower() if task else 'unknown'
-                    possible_names = [task_name_lower, 'run', 'execute']
-                    
-                    function_called = False
-                    for func_name in possible_names:
-                        if hasattr(golden_module, func_name) and callable(getattr(golden_module, func_name)):
-                            func = getattr(golden_module, func_name)
-                            func(mem_file_relative, golden_file_relative)
-                            function_called = True
-                            break
-                    
-                    if not function_called:
-                        # If no appropriate function found, re-execute with __name__ = "__main__"
-                        # This is a fallback that should work for most cases
-                        exec(spec.loader.get_data(golden_path).decode('utf-8'), 
-                             {'__name__': '__main__', '__file__': golden_path})
-                
-                output(f"Golden model '{task}' executed successfully")
-                
-            finally:
-                # Restore original state
-                os.chdir(original_cwd)
-                sys.path = original_path
-                sys.argv = original_argv
-                
         except Exception as e:
+            # _load_model's stat doubles as the existence check
+            if isinstance(e, FileNotFoundError) and e.filename == golden_path:
+                raise FileNotFoundError(f"Golden model not found: {golden_path}") from None
             error_msg = f"Failed to execute golden model '{task}': {str(e)}"
             output(error_msg)
             raise RuntimeError(error_msg)
     
+    def prefetch(self, tasks: Iterable[str]):
+        """
+        Load the golden models of tasks in a background thread, so a following
+        run_golden_model finds the module compiled and its cached outputs in the
+        OS page cache. Unknown tasks are skipped.
+        
+        :param tasks: Task names to prepare
+        :return: The started thread, or None if there was nothing to prefetch
+        """
+        tasks = [task for task in tasks if self.validate_model(task)]
+        if not tasks:
+            return None
+        thread = threading.Thread(target=self._prefetch, args=(tasks,), name="golden-prefetch", daemon=True)
+        thread.start()
+        return thread
+    
+    def _prefetch(self, tasks):
+        """Body of the prefetch thread."""
+        for task in tasks:
+            golden_path = self._golden_path(task)
+            try:
+                stamp, golden_module, _ = self._load_model(task, golden_path)
+                if getattr(golden_module, "DETERMINISTIC", False):
+                    for path in self._cached_outputs(golden_path, stamp, False):
+                        self._warm_file(path)
+            except Exception:
+                # run_golden_model reports the error when the model is actually run
+                pass
+    
+    @staticmethod
+    def _warm_file(path: str):
+        """Pull path into the OS page cache (posix_fadvise where available, else a plain read)."""
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            else:
+                while os.read(fd, 1 << 20):
+                    pass
+        finally:
+            os.close(fd)
+    
+    def _golden_path(self, task: str) -> str:
+        """Return the path of the golden.py script of task."""
+        return self._task_prefix + task + self._golden_suffix
+    
+    def _model_dir(self, golden_path: str) -> str:
+        """Return the directory of golden_path, memoized."""
+        model_dir = self._model_dirs.get(golden_path)
+        if model_dir is None:
+            model_dir = self._model_dirs[golden_path] = os.path.dirname(golden_path)
+        return model_dir
+    
+    def _load_model(self, task: str, golden_path: str):
+        """
+        Return (source stamp, module, entry point) of the golden model at golden_path.
+        The module is executed once and cached together with its entry point;
+        later calls for the same path skip parsing, compiling and the lookup
+        until the script or a shared helper module changes on disk.
+        """
+        with self._module_lock:
+            stamp = self._source_stamp(golden_path)
+            if stamp[0] is None:
+                raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), golden_path)
+            cached = self._module_cache.get(golden_path)
+            if cached is not None:
+                if cached[0] == stamp:
+                    return cached
+                # Edited: re-import the shared helpers too, they may be what changed
+                for name in GOLDEN_SHARED_MODULES:
+                    sys.modules.pop(os.path.splitext(name)[0], None)
+            
+            # Imported here: only needed once a model is actually loaded
+            import importlib.util
+            # Registered under a stable per-task name, so code that looks a class's module
+            # up in sys.modules (dataclasses, pickle) works inside golden models
+            module_name = f"golden_model_{task}"
+            spec = importlib.util.spec_from_file_location(
+                module_name, golden_path, loader=self._model_loader(module_name, golden_path, stamp))
+            golden_module = importlib.util.module_from_spec(spec)
+            
+            # Let the model import helpers next to it while it is being loaded
+            # (only the slot we add is undone, instead of copying the whole list)
+            model_dir = self._model_dir(golden_path)
+            prepended = model_dir not in sys.path
+            if prepended:
+                sys.path.insert(0, model_dir)
+            sys.modules[module_name] = golden_module
+            try:
+                spec.loader.exec_module(golden_module)
+            except BaseException:
+                sys.modules.pop(module_name, None)
+                raise
+            finally:
+                if prepended and model_dir in sys.path:
+                    sys.path.remove(model_dir)
+            
+            # Since __name__ is not "__main__" when using importlib, call the
+            # model function (mem_file, golden_file) directly
+            for name in GOLDEN_ENTRY_POINTS:
+                entry_point = getattr(golden_module, name, None)
+                if callable(entry_point):
+                    break
+            else:
+                raise RuntimeError(f"No suitable main function found in golden model for task '{task}'")
+            
+            cached = self._module_cache[golden_path] = (stamp, golden_module, entry_point)
+            return cached
+    
+    def _model_loader(self, module_name: str, golden_path: str, stamp):
+        """
+        Return a loader for golden_path's bytecode in the cache directory, compiling
+        it on first use, or a plain source loader if that is not possible. Given
+        explicitly, spec_from_file_location skips looking the loader up by suffix.
+        Unlike __pycache__ this also works with PYTHONDONTWRITEBYTECODE and survives
+        reextraction of a packaged build's data.
+        """
+        import py_compile
+        from importlib.machinery import SourceFileLoader, SourcelessFileLoader
+        
+        tag = sys.implementation.cache_tag
+        if tag is None:
+            return SourceFileLoader(module_name, golden_path)
+        
+        cache_dir = os.path.join(self._model_dir(golden_path), GOLDEN_CACHE_DIR)
+        sig = self._signature(stamp)
+        cfile = os.path.join(cache_dir, f"{sig}.golden.{tag}.pyc")
+        if not os.path.isfile(cfile):
+            try:
+                py_compile.compile(golden_path, cfile=cfile, doraise=True)
+                for name in os.listdir(cache_dir):
+                    if name.endswith(".pyc") and not name.startswith(sig + "."):
+                        os.remove(os.path.join(cache_dir, name))
+            except (OSError, py_compile.PyCompileError):
+                # Read-only install, or a syntax error that exec_module reports from the source
+                return SourceFileLoader(module_name, golden_path)
+        return SourcelessFileLoader(module_name, cfile)
+    
+    @staticmethod
+    def _signature(stamp) -> str:
+        """Return the short hash of a source stamp that prefixes the cache file names."""
+        return hashlib.sha1(repr(stamp).encode()).hexdigest()[:12]
+    
+    def _source_stamp(self, golden_path: str):
+        """Return (mtime_ns, size) of the script and of each shared helper module (None if missing)."""
+        stamp = []
+        for path in (golden_path,) + self._shared_paths:
+            try:
+                st = os.stat(path)
+                stamp.append((st.st_mtime_ns, st.st_size))
+            except FileNotFoundError:
+                stamp.append(None)
+        return tuple(stamp)
+    
+    def _cached_outputs(self, golden_path: str, stamp, binary: bool):
+        """
+        Return the (memdata, golden) cache file paths for the version of golden_path
+        described by stamp (see _source_stamp); names start with a signature of the
+        mtime and size of the script and of the shared helper modules it imports.
+        """
+        sig = self._signature(stamp)
+        cache_dir = os.path.join(self._model_dir(golden_path), GOLDEN_CACHE_DIR)
+        ext = "bin" if binary else "txt"
+        return (os.path.join(cache_dir, f"{sig}.memdata.{ext}"),
+                os.path.join(cache_dir, f"{sig}.golden.{ext}"))
+    
+    @staticmethod
+    def _copy_outputs(sources, mem_file: str, golden_file: str, binary: bool):
+        """Copy cached outputs (and binary sidecars) to mem_file and golden_file."""
+        for src, dst in zip(sources, (mem_file, golden_file)):
+            shutil.copyfile(src, dst)
+            if binary:
+                shutil.copyfile(src + ".json", dst + ".json")
+    
+    def _store_outputs(self, targets, mem_file: str, golden_file: str, binary: bool):
+        """Save freshly generated outputs as the cache, dropping earlier script versions."""
+        cache_dir = os.path.dirname(targets[0])
+        sig = os.path.basename(targets[0]).split(".", 1)[0]
+        pairs = [(mem_file, targets[0]), (golden_file, targets[1])]
+        if binary:
+            pairs += [(src + ".json", dst + ".json") for src, dst in pairs]
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            for name in os.listdir(cache_dir):
+                if not name.startswith(sig + "."):
+                    os.remove(os.path.join(cache_dir, name))
+            # Sidecars first and each file via a temporary name, so a cache hit
+            # never sees a partially written entry
+            for src, dst in reversed(pairs):
+                shutil.copyfile(src, dst + ".tmp")
+                os.replace(dst + ".tmp", dst)
+        except OSError:
+            # A read-only install just runs the model every time
+            pass
+    
+    def run_batch(self, jobs: Iterable[Tuple[str, str, str]],
+                  stdout_callback: Optional[Callable[[str], None]] = None,
+                  binary: bool = False, max_workers: Optional[int] = None):
+        """
+        Execute several independent golden models in parallel worker processes.
+        
+        :param jobs: (task, mem_file, golden_file) tuples, paths as for run_golden_model
+        :param stdout_callback: Optional callback for output messages, relayed in job order
+        :param binary: Ask the golden models for raw binary output instead of text
+        :param max_workers: Number of worker processes (defaults to os.cpu_count())
+        
+        The workers stay alive after the call, with numpy imported and the models
+        loaded, so later batches start warm; call shutdown() to stop them.
+        """
+        output = stdout_callback or print
+        
+        jobs = list(jobs)
+        if not jobs:
+            return
+        # Fail before starting any worker if a model is missing
+        for task, _, _ in jobs:
+            if not self.validate_model(task):
+                raise FileNotFoundError(f"Golden model not found: {self._golden_path(task)}")
+        
+        # Imported here: multiprocessing is only needed by batch runs
+        from concurrent.futures.process import BrokenProcessPool
+        executor = self._get_batch_executor(max_workers or os.cpu_count() or 1)
+        
+        data_dir = os.path.abspath(self.data_dir)
+        try:
+            futures = [executor.submit(_run_batch_job, data_dir, task, mem_file, golden_file, binary)
+                       for task, mem_file, golden_file in jobs]
+            results = [future.result() for future in futures]
+        except BrokenProcessPool:
+            # A worker died; start a fresh pool next time
+            self.shutdown()
+            raise
+        
+        failed = []
+        for (task, _, _), (messages, error) in zip(jobs, results):
+            for msg in messages:
+                output(msg)
+            if error:
+                failed.append(task)
+        if failed:
+            raise RuntimeError(f"Failed to execute golden models: {', '.join(failed)}")
+    
+    def _get_batch_executor(self, max_workers: int):
+        """Return the persistent batch pool, recreating it if max_workers changed."""
+        if self._batch_executor is not None and self._batch_workers == max_workers:
+            return self._batch_executor
+        self.shutdown()
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        # Spawned workers do not inherit the GUI's threads and Qt state as forked ones would;
+        # they are started on demand, so a large max_workers costs nothing until used
+        self._batch_executor = ProcessPoolExecutor(max_workers=max_workers,
+                                                   mp_context=multiprocessing.get_context("spawn"))
+        self._batch_workers = max_workers
+        return self._batch_executor
+    
+    def shutdown(self):
+        """Stop the run_batch worker processes, if any are running."""
+        if self._batch_executor is not None:
+            self._batch_executor.shutdown(wait=True)
+            self._batch_executor = None
+            self._batch_workers = 0
+    
     def list_available_models(self):
-        """List all available golden models."""
+        """
+        List all available golden models.
+        The scan is reused until the mtime of input_dir changes, i.e. until a
+        task directory is added, removed or renamed.
+        """
+        try:
+            mtime = os.stat(self.input_dir).st_mtime_ns
+        except FileNotFoundError:
+            return []
+        if self._models_cache is not None and self._models_cache[0] == mtime:
+            return list(self._models_cache[1])
+        
+        # Directories were added or removed: earlier validate_model answers may be stale too
+        if self._models_cache is not None:
+            _golden_found.clear()
         models = []
-        if os.path.exists(self.input_dir):
-            for task_dir in os.listdir(self.input_dir):
-                task_path = os.path.join(self.input_dir, task_dir)
-                if os.path.isdir(task_path):
-                    golden_path = os.path.join(task_path, "golden.py")
-                    if os.path.exists(golden_path):
-                        models.append(task_dir)
+        # scandir yields the entry type with the name, so only golden.py needs a stat
+        with os.scandir(self.input_dir) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False) and self._has_golden(entry.path):
+                    models.append(entry.name)
+        self._models_cache = (mtime, tuple(models))
+        self._valid_tasks = frozenset(models)
         return models
     
     def validate_model(self, task: str):
-        """Check if a golden model exists for the given task."""
-        golden_path = os.path.join(self.input_dir, task, "golden.py")
-        return os.path.exists(golden_path)
+        """
+        Check if a golden model exists for the given task.
+        Tasks seen by the last list_available_models scan are answered from it; others
+        are checked on disk until found, then cached. Call invalidate() after removing models.
+        """
+        if task in self._valid_tasks:
+            return True
+        return _golden_exists(self.input_dir, task)
+    
+    def invalidate(self):
+        """Forget cached validate_model and list_available_models results."""
+        _golden_found.clear()
+        self._models_cache = None
+        self._valid_tasks = frozenset()
+    
+    @staticmethod
+    def _has_golden(task_path: str) -> bool:
+        """Return True if task_path contains a golden.py file."""
+        # A single access() call, without the stat result os.path.exists builds
+        return os.access(f"{task_path}{os.sep}golden.py", os.F_OK)
+
+
+# (input_dir, task) pairs known to have a golden.py. Only positive answers are kept,
+# so a model added after a failed check is found by the next one
+_golden_found = set()
+
+
+def _golden_exists(input_dir: str, task: str) -> bool:
+    """Cached GoldenModelManager.validate_model check, keyed by (input_dir, task)."""
+    key = (input_dir, task)
+    if key in _golden_found:
+        return True
+    if GoldenModelManager._has_golden(os.path.join(input_dir, task)):
+        _golden_found.add(key)
+        return True
+    return False
 
 
 # Global instance (will be initialized by validator module)
 _golden_manager = None
 
+# Managers of a batch worker process, keyed by data_dir, so its module cache is reused across jobs
+_batch_managers = {}
+
+
+def _run_batch_job(data_dir: str, task: str, mem_file: str, golden_file: str, binary: bool):
+    """
+    Run one golden model inside a batch worker process.
+    Defined at module level so it can be pickled; returns (messages, error).
+    """
+    manager = _batch_managers.get(data_dir)
+    if manager is None:
+        manager = _batch_managers[data_dir] = GoldenModelManager(data_dir)
+    messages = []
+    try:
+        manager.run_golden_model(task, mem_file, golden_file, messages.append, binary=binary)
+        return messages, None
+    except Exception as e:
+        if not messages:
+            messages.append(f"Failed to execute golden model '{task}': {e}")
+        return messages, str(e)
+
 
 def get_golden_manager(data_dir: str = None):
     """Get or create the global golden model manager."""
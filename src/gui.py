@@ -9,38 +9,39 @@ PerfSimGUI - Modularized Version
 """
 
 import sys
-import json
 import os
+import zlib
+from functools import lru_cache
+
+# orjson parses the config files several times faster when installed; both accept bytes
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 # Add current directory to Python path for local imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout,
-    QHBoxLayout, QPushButton, QTextEdit, QTabWidget,
-    QTableWidget, QTableWidgetItem, QLabel, QHeaderView,
+    QHBoxLayout, QPushButton, QTextEdit, QPlainTextEdit, QTabWidget,
+    QTableView, QLabel, QHeaderView,
     QComboBox, QGroupBox, QSplitter
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
-
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-import matplotlib.pyplot as plt
-import matplotlib
+from PyQt6.QtCore import Qt, QTimer, QThreadPool, QSignalBlocker
+from PyQt6.QtGui import QFont, QTextCursor
 
 # Import our custom modules
 from ui.xml_highlighter import XmlSyntaxHighlighter
 from ui.styles import APP_STYLESHEET, CHART_BACKGROUND_COLOR
-from ui.charts import update_bar_chart, update_radar_chart, setup_chart_style
+from ui.charts import setup_chart_style, BarChartBlitter, RadarChartBlitter
+from ui.tables import TextTableModel
 from utils import slugify, format_bytes, format_number_with_commas, format_float_precision, cache_key
 
-# Configure matplotlib to support Chinese fonts and fix unicode issues
-matplotlib.rcParams['font.sans-serif'] = ['Arial Unicode MS', 'SimHei', 'DejaVu Sans', 'Arial', 'sans-serif']
-matplotlib.rcParams['axes.unicode_minus'] = False
-matplotlib.rcParams['font.family'] = 'sans-serif'
-
-# Use CGRAValidationThread for running CGRA validation in background
-from thread import CGRAValidationThread
+# Use CGRAValidationJob for running CGRA validation in background
+from thread import CGRAValidationJob, LogFileReader
+from golden_models import get_golden_manager
+from validator import prewarm
 from resource_path import get_resource_path, get_project_root, get_config_path
 
 
@@ -50,11 +51,119 @@ from resource_path import get_resource_path, get_project_root, get_config_path
 # Get the project root directory (works in both dev and packaged environments)
 PROJECT_ROOT = get_project_root()
 
-with open(get_config_path("architecture.json"), "r", encoding="utf-8") as f:
-    ARCH_DATA = json.load(f)
+@lru_cache(maxsize=None)
+def _load_config(filename: str) -> dict:
+    """Parse a JSON file from the config directory (once; later calls reuse the result)."""
+    with open(get_config_path(filename), "rb") as f:
+        return json_loads(f.read())
+
+
+def get_arch_data() -> dict:
+    """Architecture parameters from architecture.json, loaded on first use."""
+    return _load_config("architecture.json")
+
+
+def get_op_data() -> dict:
+    """Operator performance data from operators.json, loaded on first use."""
+    return _load_config("operators.json")
+
+
+def _format_arch_row(arch: str, params: dict):
+    """Return the (top table, bottom table) cell texts of one architecture."""
+    clock_rate = params.get("clock_rate", "-")
+    top = (
+        params.get("name", arch),
+        str(params.get("process", "-")),
+        format_number_with_commas(clock_rate) if isinstance(clock_rate, (int, float)) else str(clock_rate),
+        str(params.get("area", "-")),
+    )
+    bottom = (
+        str(params.get("cores", "-")),
+        str(params.get("ALU_per_core", "-")),
+        str(params.get("FPU_per_core", "-")),
+        format_bytes(params.get("L1_size", "-")),
+        format_bytes(params.get("L2_size", "-")),
+    )
+    return top, bottom
+
+
+@lru_cache(maxsize=None)
+def _configure_matplotlib():
+    """
+    Import matplotlib and apply the font settings on first use (done once), so the
+    import and font-manager work only happen when a chart tab is first built.
+    
+    :return: (Figure, FigureCanvas) classes for embedding charts
+    """
+    import matplotlib
+    from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+    from matplotlib.figure import Figure
+
+    # Configure matplotlib to support Chinese fonts and fix unicode issues
+    matplotlib.rcParams['font.sans-serif'] = ['Arial Unicode MS', 'SimHei', 'DejaVu Sans', 'Arial', 'sans-serif']
+    matplotlib.rcParams['axes.unicode_minus'] = False
+    matplotlib.rcParams['font.family'] = 'sans-serif'
+    return Figure, FigureCanvas
+
+
+@lru_cache(maxsize=None)
+def _arch_rows():
+    """Formatted cell texts of every architecture, in architecture.json order (computed once)."""
+    return tuple(_format_arch_row(arch, params) for arch, params in get_arch_data().items())
+
+
+@lru_cache(maxsize=None)
+def _perf_rows(op_name: str):
+    """Formatted performance table rows of an operator, one per architecture (computed once)."""
+    rows = []
+    for arch, metrics in get_op_data()[op_name].items():
+        rows.append((
+            arch,
+            format_number_with_commas(metrics.get("cycle", 0)),
+            format_float_precision(metrics.get("throughput", 0)),
+            format_number_with_commas(metrics.get("latency", 0)),
+            format_float_precision(metrics.get("power", 0)),
+            format_float_precision(metrics.get("efficiency", 0)),
+            format_float_precision(metrics.get("density", 0)),
+        ))
+    return tuple(rows)
+
+
+@lru_cache(maxsize=None)
+def _xml_candidates(op_name: str):
+    """Paths where the XML configuration of an operator may be found, in lookup order (computed once)."""
+    cgra_entry = get_op_data().get(op_name, {}).get("CGRA", {})
+    explicit_path = cgra_entry.get("config_xml")
+    candidates = []
+    if explicit_path:
+        # Normalize path separators for cross-platform compatibility
+        explicit_path = explicit_path.replace("/", os.sep).replace("\\", os.sep)
+        
+        # Handle both absolute and relative paths
+        # If relative path starts with ./, resolve it relative to PROJECT_ROOT
+        if explicit_path.startswith("." + os.sep):
+            candidates.append(os.path.normpath(os.path.join(PROJECT_ROOT, explicit_path[2:])))
+        else:
+            candidates.append(os.path.normpath(explicit_path))
+            # Also try relative to PROJECT_ROOT
+            candidates.append(os.path.normpath(os.path.join(PROJECT_ROOT, explicit_path)))
+    slug = slugify(op_name)
+    candidates.append(os.path.normpath(os.path.join(PROJECT_ROOT, "op_xml", f"{slug}.xml")))
+    return tuple(candidates)
+
 
-with open(get_config_path("operators.json"), "r", encoding="utf-8") as f:
-    OP_DATA = json.load(f)
+def __getattr__(name: str):
+    """Keep gui.ARCH_DATA / gui.OP_DATA working without reading the files at import time."""
+    if name == "ARCH_DATA":
+        return get_arch_data()
+    if name == "OP_DATA":
+        return get_op_data()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Log view: how often queued runner output is flushed
+LOG_FLUSH_INTERVAL_MS = 50
+# Logs not being viewed are kept zlib-compressed once they reach this many characters
+LOG_PACK_MIN_CHARS = 64 * 1024
 
 
 class PerfSimGUI(QMainWindow):
@@ -68,14 +177,41 @@ class PerfSimGUI(QMainWindow):
         self.setStyleSheet(APP_STYLESHEET)
 
         # Cache for logs keyed by "<operator>::<arch>"
-        # value: string containing entire log (we append lines)
+        # value: list of text chunks (lines with their newline); appending is O(1)
+        # and the full text is only joined when a whole log is displayed
         self.log_cache = {}
+        # Idle entries of log_cache packed with zlib (the list is then empty until unpacked)
+        self._packed_logs = {}
+
+        # How many chunks of each log_cache entry perf_log already shows; the rest is
+        # appended by a single-shot timer so a burst of output costs one repaint
+        self._ui_offset = {}
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_flush_timer.timeout.connect(self._flush_pending_logs)
+
+        # Non-CGRA log files are read off the UI thread; _log_seen holds how many
+        # bytes of each file are already in log_cache so only new bytes are read
+        self._log_pool = QThreadPool(self)
+        # Log reads are disk-bound; more threads would only compete for the same disk
+        self._log_pool.setMaxThreadCount(2)
+        self._log_seen = {}
+        self._log_reads_in_flight = set()
 
         # Track running runners by key to avoid duplicate UI updates
         self.running_runners = set()
         
-        # Track active validation threads
-        self.validation_threads = {}
+        # Validation jobs run on a persistent pool instead of a fresh QThread each.
+        # Every run writes the same golden_memdata.txt and output/memorywrite.txt,
+        # so one worker: further runs queue instead of overwriting each other's files
+        self._validation_pool = QThreadPool(self)
+        self._validation_pool.setMaxThreadCount(1)
+        # Track queued or running validation jobs
+        self.validation_jobs = {}
+        # Every job started and not yet done, cleared ones included; jobs are not
+        # auto-deleted, so this reference keeps them alive until signals.done
+        self._live_jobs = set()
 
         main_widget = QWidget()
         main_layout = QHBoxLayout(main_widget)
@@ -87,8 +223,7 @@ class PerfSimGUI(QMainWindow):
         operator_layout = QVBoxLayout(operator_group)
 
         self.operator_combo = QComboBox()
-        for op_name in OP_DATA.keys():
-            self.operator_combo.addItem(op_name)
+        self.operator_combo.addItems(list(get_op_data().keys()))
         operator_layout.addWidget(self.operator_combo)
 
         # Operator XML viewer with enhanced styling
@@ -105,18 +240,19 @@ class PerfSimGUI(QMainWindow):
         # -------------------------------
         # Architecture tables (split into two rows) with enhanced styling
         # -------------------------------
-        self.arch_table_top = QTableWidget(len(ARCH_DATA), 4)
-        self.arch_table_top.setHorizontalHeaderLabels([
+        # Center align all cells except the architecture name in the top table
+        self.arch_table_top = QTableView()
+        self.arch_table_top.setModel(TextTableModel([
             "架构", "制程工艺 (nm)", "时钟频率 (MHz)", "面积 (mm²)"
-        ])
+        ], centered_from=1, parent=self))
         self.arch_table_top.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.arch_table_top.setEditTriggers(self.arch_table_top.EditTrigger.NoEditTriggers)
         self.arch_table_top.setAlternatingRowColors(True)
 
-        self.arch_table_bottom = QTableWidget(len(ARCH_DATA), 5)
-        self.arch_table_bottom.setHorizontalHeaderLabels([
+        self.arch_table_bottom = QTableView()
+        self.arch_table_bottom.setModel(TextTableModel([
             "核心数", "ALU/核心", "FPU/核心", "L1缓存", "L2缓存"
-        ])
+        ], parent=self))
         self.arch_table_bottom.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.arch_table_bottom.setEditTriggers(self.arch_table_bottom.EditTrigger.NoEditTriggers)
         self.arch_table_bottom.setAlternatingRowColors(True)
@@ -148,8 +284,18 @@ class PerfSimGUI(QMainWindow):
         # -------------------------------
         self.tabs = QTabWidget()
         self.tabs.addTab(self.create_table_tab(), "📊 性能表格")
-        self.tabs.addTab(self.create_bar_chart_tab(), "📈 柱状图")
-        self.tabs.addTab(self.create_radar_chart_tab(), "🎯 雷达图")
+        # Chart tabs start as placeholders; the matplotlib figures are only built
+        # the first time a tab is shown (see _on_tab_changed)
+        self.bar_blitter = None
+        self.radar_blitter = None
+        self._chart_data = None
+        self._chart_tab_builders = {
+            1: (self.create_bar_chart_tab, "📈 柱状图"),
+            2: (self.create_radar_chart_tab, "🎯 雷达图"),
+        }
+        for _builder, label in self._chart_tab_builders.values():
+            self.tabs.addTab(QWidget(), label)
+        self.tabs.currentChanged.connect(self._on_tab_changed)
 
         right_layout = QVBoxLayout()
         right_layout.addWidget(self.tabs)
@@ -170,6 +316,9 @@ class PerfSimGUI(QMainWindow):
         self.operator_combo.currentTextChanged.connect(self.load_selected_operator_xml)
         self.operator_combo.currentTextChanged.connect(self.populate_arch_selector)
 
+        # Arch selection drives the log view; connected exactly once
+        self.arch_combo.currentTextChanged.connect(self.update_log_view, Qt.ConnectionType.UniqueConnection)
+
         # Populate static data
         self.populate_arch_tables()
         self.populate_arch_selector()
@@ -177,43 +326,17 @@ class PerfSimGUI(QMainWindow):
         # Load initial operator XML
         self.load_selected_operator_xml()
 
+        # Compile the compare kernel in the background before the first validation needs it
+        prewarm()
+
     # -------------------------------
     # Populate architecture tables
     # -------------------------------
     def populate_arch_tables(self):
-        """Fill static architecture parameter tables from ARCH_DATA."""
-        for i, arch in enumerate(ARCH_DATA.keys()):
-            params = ARCH_DATA[arch]
-            self.arch_table_top.setItem(i, 0, QTableWidgetItem(params.get("name", arch)))
-            
-            # Format numerical values properly using utility functions
-            process_val = params.get("process", "-")
-            clock_rate_val = params.get("clock_rate", "-")
-            area_val = params.get("area", "-")
-            cores_val = params.get("cores", "-")
-            alu_val = params.get("ALU_per_core", "-")
-            fpu_val = params.get("FPU_per_core", "-")
-            l1_val = params.get("L1_size", "-")
-            l2_val = params.get("L2_size", "-")
-            
-            self.arch_table_top.setItem(i, 1, QTableWidgetItem(f"{process_val}" if process_val != "-" else "-"))
-            self.arch_table_top.setItem(i, 2, QTableWidgetItem(format_number_with_commas(clock_rate_val) if isinstance(clock_rate_val, (int, float)) else str(clock_rate_val)))
-            self.arch_table_top.setItem(i, 3, QTableWidgetItem(f"{area_val}" if area_val != "-" else "-"))
-            self.arch_table_bottom.setItem(i, 0, QTableWidgetItem(f"{cores_val}" if cores_val != "-" else "-"))
-            self.arch_table_bottom.setItem(i, 1, QTableWidgetItem(f"{alu_val}" if alu_val != "-" else "-"))
-            self.arch_table_bottom.setItem(i, 2, QTableWidgetItem(f"{fpu_val}" if fpu_val != "-" else "-"))
-            self.arch_table_bottom.setItem(i, 3, QTableWidgetItem(format_bytes(l1_val)))
-            self.arch_table_bottom.setItem(i, 4, QTableWidgetItem(format_bytes(l2_val)))
-            
-            # Center align architecture table content (except first column)
-            for col in range(1, 4):
-                if self.arch_table_top.item(i, col):
-                    self.arch_table_top.item(i, col).setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            # Center align all content in bottom table
-            for col in range(5):
-                if self.arch_table_bottom.item(i, col):
-                    self.arch_table_bottom.item(i, col).setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+        """Fill static architecture parameter tables from architecture.json."""
+        rows = _arch_rows()
+        self.arch_table_top.model().set_rows([top for top, _bottom in rows])
+        self.arch_table_bottom.model().set_rows([bottom for _top, bottom in rows])
 
     # -------------------------------
     # Populate architecture selector (instead of tags)
@@ -222,38 +345,28 @@ class PerfSimGUI(QMainWindow):
         """
         Populate arch_combo with architectures from the currently selected operator.
         Preferred default selection: CGRA if present, otherwise first.
-        Ensure we don't connect update_log_view multiple times.
+        Items are swapped with signals blocked; the log view is refreshed once explicitly.
         """
-        self.arch_combo.clear()
         selected_op = self.operator_combo.currentText()
-        if not selected_op or selected_op not in OP_DATA:
-            return
-
-        # Add all available architectures for the selected operator
-        arch_list = list(OP_DATA[selected_op].keys())
-        for arch in arch_list:
-            self.arch_combo.addItem(arch)
-
-        # Prevent duplicate connections: disconnect if already connected
-        try:
-            self.arch_combo.currentTextChanged.disconnect(self.update_log_view)
-        except Exception:
-            # no-op if not previously connected
-            pass
-
-        # Connect log update
-        self.arch_combo.currentTextChanged.connect(self.update_log_view)
-
-        # Default selection rule:
-        # 1) If "CGRA" exists, select it by default
-        # 2) Otherwise, select the first available architecture
-        if "CGRA" in arch_list:
-            idx = arch_list.index("CGRA")
-            self.arch_combo.setCurrentIndex(idx)
-            # Update view for CGRA selection (will show CGRA hint or cached CGRA log)
-            self.update_log_view("CGRA")
-        elif self.arch_combo.count() > 0:
-            self.arch_combo.setCurrentIndex(0)
+        with QSignalBlocker(self.arch_combo):
+            self.arch_combo.clear()
+            if not selected_op or selected_op not in get_op_data():
+                return
+
+            # Add all available architectures for the selected operator (one call)
+            arch_list = list(get_op_data()[selected_op].keys())
+            self.arch_combo.addItems(arch_list)
+
+            # Default selection rule:
+            # 1) If "CGRA" exists, select it by default
+            # 2) Otherwise, select the first available architecture
+            if "CGRA" in arch_list:
+                self.arch_combo.setCurrentIndex(arch_list.index("CGRA"))
+            elif self.arch_combo.count() > 0:
+                self.arch_combo.setCurrentIndex(0)
+
+        # Update view for the default selection (shows CGRA hint or cached log)
+        if self.arch_combo.count() > 0:
             self.update_log_view(self.arch_combo.currentText())
 
     # -------------------------------
@@ -261,11 +374,110 @@ class PerfSimGUI(QMainWindow):
     # -------------------------------
     def _append_to_log_cache(self, key: str, line: str):
         """Append a line (with newline) to the cache for the given key."""
-        if key in self.log_cache:
-            self.log_cache[key] += line + "\n"
-        else:
-            self.log_cache[key] = line + "\n"
+        self._log_chunks(key).append(line + "\n")
+
+    def _get_log(self, key: str) -> str:
+        """Return the full cached log text for the given key."""
+        return "".join(self._log_chunks(key)) if key in self.log_cache else ""
+
+    def _log_chunks(self, key: str) -> list:
+        """Return the chunk list of key in log_cache (created if missing), unpacking it if needed."""
+        chunks = self.log_cache.setdefault(key, [])
+        packed = self._packed_logs.pop(key, None)
+        if packed is not None:
+            chunks[:] = [zlib.decompress(packed).decode("utf-8")]
+        return chunks
+
+    def _pack_log(self, key: str):
+        """Compress the cached log of key while it is not viewed (running CGRA logs excepted)."""
+        chunks = self.log_cache.get(key)
+        if not chunks or key in self.running_runners:
+            return
+        text = "".join(chunks)
+        if len(text) >= LOG_PACK_MIN_CHARS:
+            self._packed_logs[key] = zlib.compress(text.encode("utf-8"), 1)
+            chunks.clear()
     
+    def _current_log_key(self) -> str:
+        """Cache key of the operator+arch currently shown in perf_log."""
+        return cache_key(self.operator_combo.currentText(), self.arch_combo.currentText())
+
+    def _queue_log_line(self, key: str, line: str):
+        """Append a line to the cache and schedule a view update if key is being viewed."""
+        self._append_to_log_cache(key, line)
+        if key == self._current_log_key():
+            if not self._log_flush_timer.isActive():
+                self._log_flush_timer.start()
+
+    def _show_cached_log(self, key: str):
+        """Replace perf_log contents with the cached log for key."""
+        self.perf_log.setPlainText(self._get_log(key))
+        self._ui_offset = {key: len(self.log_cache[key])}
+
+    def _flush_pending_logs(self):
+        """Append the not yet shown part of the current selection's log to perf_log."""
+        key = self._current_log_key()
+        chunks = self.log_cache.get(key)
+        offset = self._ui_offset.get(key, 0)
+        if not chunks or offset >= len(chunks):
+            return
+        self._ui_offset[key] = len(chunks)
+        self.perf_log.setUpdatesEnabled(False)
+        try:
+            self.perf_log.moveCursor(QTextCursor.MoveOperation.End)
+            self.perf_log.insertPlainText("".join(chunks[offset:]))
+        finally:
+            self.perf_log.setUpdatesEnabled(True)
+        self.perf_log.verticalScrollBar().setValue(self.perf_log.verticalScrollBar().maximum())
+
+    def _resolve_log_path(self, log_path: str) -> str:
+        """Resolve a configured log_path relative to the project root."""
+        if log_path.startswith("./"):
+            # Remove ./ prefix and resolve relative to PROJECT_ROOT
+            return os.path.normpath(os.path.join(PROJECT_ROOT, log_path[2:]))
+        if os.path.isabs(log_path):
+            # Already absolute path
+            return os.path.normpath(log_path)
+        # Relative path without ./, resolve relative to PROJECT_ROOT
+        return os.path.normpath(os.path.join(PROJECT_ROOT, log_path))
+
+    def _request_log_read(self, key: str, arch_name: str, metrics: dict):
+        """Read the new part of an architecture's log file in the thread pool."""
+        log_path = metrics.get("log_path", "")
+        if not log_path:
+            self.perf_log.appendPlainText(f"[{arch_name}] No log path specified in configuration.\n")
+            return
+        if key in self._log_reads_in_flight:
+            return
+        reader = LogFileReader(key, self._resolve_log_path(log_path), self._log_seen.get(key, 0))
+        reader.signals.finished.connect(self._on_log_read)
+        reader.signals.failed.connect(self._on_log_read_failed)
+        self._log_reads_in_flight.add(key)
+        self._log_pool.start(reader)
+
+    def _on_log_read(self, key: str, text: str, start: int, end: int):
+        """Merge a log file read into the cache and show it if key is being viewed."""
+        self._log_reads_in_flight.discard(key)
+        # A tail read that no longer continues the cache (e.g. cleared meanwhile) is stale
+        if start and (key not in self.log_cache or start != self._log_seen.get(key)):
+            return
+        self._log_seen[key] = end
+        if start == 0:
+            self._packed_logs.pop(key, None)
+            self.log_cache[key] = [text]
+            if key == self._current_log_key():
+                self._show_cached_log(key)
+        else:
+            self._log_chunks(key).append(text)
+            if key == self._current_log_key() and not self._log_flush_timer.isActive():
+                self._log_flush_timer.start()
+
+    def _on_log_read_failed(self, key: str, message: str):
+        """Report a failed log file read if key is being viewed."""
+        self._log_reads_in_flight.discard(key)
+        if key == self._current_log_key():
+            self.perf_log.appendPlainText(f"[{self.arch_combo.currentText()}] {message}\n")
+
     def _get_task_name_from_operator(self, operator_name: str) -> str:
         """
         Map operator name to task name for CGRA validation.
@@ -291,60 +503,42 @@ class PerfSimGUI(QMainWindow):
         """
         Show cached log for (current operator, arch) if present.
         If not cached:
-          - for non-CGRA: read log_path into cache and display
+          - for non-CGRA: read log_path into cache in the background and display
           - for CGRA: show message indicating to Run Simulation (or show cached CGRA log if present)
         """
         self.perf_log.clear()
+        # The log shown until now goes idle; pack it if it is large
+        for shown_key in self._ui_offset:
+            self._pack_log(shown_key)
+        # Whatever is shown next starts from an empty view
+        self._ui_offset.clear()
         selected_op = self.operator_combo.currentText()
-        if not selected_op or arch_name not in OP_DATA[selected_op]:
+        if not selected_op or arch_name not in get_op_data()[selected_op]:
             return
 
         key = cache_key(selected_op, arch_name)
 
+        metrics = get_op_data()[selected_op][arch_name]
+
         # If cached, display cache immediately
         if key in self.log_cache:
-            self.perf_log.append(self.log_cache[key])
+            self._show_cached_log(key)
+            # Non-CGRA logs come from files; pick up anything appended since the last read
+            if arch_name != "CGRA":
+                self._request_log_read(key, arch_name, metrics)
             return
 
-        # Not cached yet
-        metrics = OP_DATA[selected_op][arch_name]
-
         if arch_name == "CGRA":
             # If CGRA already running, show interim message and let callbacks update cache/UI later
             if key in self.running_runners:
-                self.perf_log.append("[CGRA] CGRA simulation is running... logs will appear when available.\n")
+                self.perf_log.appendPlainText("[CGRA] CGRA simulation is running... logs will appear when available.\n")
             else:
                 # show user hint to start CGRA simulation
-                self.perf_log.append("[CGRA] No cached CGRA log. Click 'Run Simulation' to execute CGRA validation.\n")
+                self.perf_log.appendPlainText("[CGRA] No cached CGRA log. Click 'Run Simulation' to execute CGRA validation.\n")
             return
 
         # For non-CGRA architectures, read the existing log file (if any), cache it and display
-        log_path = metrics.get("log_path", "")
-        if log_path:
-            # Handle relative paths - normalize and resolve relative to project root
-            if log_path.startswith("./"):
-                # Remove ./ prefix and resolve relative to PROJECT_ROOT
-                resolved_path = os.path.normpath(os.path.join(PROJECT_ROOT, log_path[2:]))
-            elif os.path.isabs(log_path):
-                # Already absolute path
-                resolved_path = os.path.normpath(log_path)
-            else:
-                # Relative path without ./, resolve relative to PROJECT_ROOT
-                resolved_path = os.path.normpath(os.path.join(PROJECT_ROOT, log_path))
-            
-            if os.path.isfile(resolved_path):
-                try:
-                    with open(resolved_path, "r", encoding="utf-8") as lf:
-                        content = lf.read()
-                    # Cache and display
-                    self.log_cache[key] = content
-                    self.perf_log.append(content)
-                except Exception as e:
-                    self.perf_log.append(f"[{arch_name}] Error reading log file '{resolved_path}': {e}\n")
-            else:
-                self.perf_log.append(f"[{arch_name}] Log file not found: {resolved_path}\n")
-        else:
-            self.perf_log.append(f"[{arch_name}] No log path specified in configuration.\n")
+        self._request_log_read(key, arch_name, metrics)
 
     # -------------------------------
     # Create Performance Table tab
@@ -354,11 +548,14 @@ class PerfSimGUI(QMainWindow):
         layout = QVBoxLayout(widget)
         perf_splitter = QSplitter(Qt.Orientation.Vertical)
 
-        self.perf_table = QTableWidget(3, 7)
-        self.perf_table.setHorizontalHeaderLabels([
+        perf_headers = [
             "架构", "周期数", "吞吐量 (GOPS)", "延迟 (ns)",
             "功耗 (W)", "能效 (GOPS/W)", "有效算力密度 (MOPS/mm²)"
-        ])
+        ]
+        # Center align performance table content (except the arch name); three blank rows until a run
+        self.perf_table = QTableView()
+        self.perf_table.setModel(TextTableModel(
+            perf_headers, [("",) * len(perf_headers)] * 3, centered_from=1, parent=self))
         # Set more evenly distributed column widths for better balance
         self.perf_table.setColumnWidth(0, 120)  # Architecture - balanced
         self.perf_table.setColumnWidth(1, 120)  # Cycles - balanced
@@ -383,7 +580,7 @@ class PerfSimGUI(QMainWindow):
         log_layout.addWidget(QLabel("选择架构查看日志"))
         log_layout.addWidget(self.arch_combo)
 
-        self.perf_log = QTextEdit()
+        self.perf_log = QPlainTextEdit()
         self.perf_log.setReadOnly(True)
         mono = QFont("Courier New")
         mono.setStyleHint(QFont.StyleHint.Monospace)
@@ -403,10 +600,15 @@ class PerfSimGUI(QMainWindow):
     def create_bar_chart_tab(self) -> QWidget:
         widget = QWidget()
         layout = QVBoxLayout(widget)
-        self.bar_fig, self.bar_ax = plt.subplots()
+        Figure, FigureCanvas = _configure_matplotlib()
+        # Plain Figure: pyplot's global figure manager has no role in an embedded canvas
+        self.bar_fig = Figure()
+        self.bar_ax = self.bar_fig.add_subplot(111)
         # Set warm color scheme for matplotlib
         setup_chart_style(self.bar_fig, self.bar_ax)
         self.bar_canvas = FigureCanvas(self.bar_fig)
+        # Bars are blitted over a cached background on repeated runs
+        self.bar_blitter = BarChartBlitter(self.bar_ax, self.bar_canvas)
         layout.addWidget(self.bar_canvas)
         return widget
 
@@ -416,15 +618,39 @@ class PerfSimGUI(QMainWindow):
     def create_radar_chart_tab(self) -> QWidget:
         widget = QWidget()
         layout = QVBoxLayout(widget)
-        self.radar_fig = plt.figure()
+        Figure, FigureCanvas = _configure_matplotlib()
+        self.radar_fig = Figure()
         # Set warm color scheme for matplotlib
         self.radar_fig.patch.set_facecolor(CHART_BACKGROUND_COLOR)
         self.radar_ax = self.radar_fig.add_subplot(111, polar=True)
         self.radar_ax.set_facecolor(CHART_BACKGROUND_COLOR)
         self.radar_canvas = FigureCanvas(self.radar_fig)
+        self.radar_blitter = RadarChartBlitter(self.radar_ax, self.radar_canvas)
         layout.addWidget(self.radar_canvas)
         return widget
 
+    def _on_tab_changed(self, index: int):
+        """Build a chart tab the first time it is shown and draw the latest run into it."""
+        entry = self._chart_tab_builders.pop(index, None)
+        if entry is None:
+            return
+        builder, label = entry
+        widget = builder()
+        # Swapping the placeholder changes the current tab; that must not re-enter here
+        with QSignalBlocker(self.tabs):
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, widget, label)
+            self.tabs.setCurrentIndex(index)
+        self._update_charts()
+
+    def _update_charts(self):
+        """Draw the latest run's performance data into the chart tabs built so far."""
+        if self._chart_data is None:
+            return
+        for blitter in (self.bar_blitter, self.radar_blitter):
+            if blitter is not None:
+                blitter.update(self._chart_data)
+
     # -------------------------------
     # Load operator XML
     # -------------------------------
@@ -432,40 +658,36 @@ class PerfSimGUI(QMainWindow):
         """Load operator-specific XML into the XML viewer (if present)."""
         selected_op = self.operator_combo.currentText()
         if not selected_op:
-            self.op_xml_view.setPlainText("")
+            self._set_xml_text("")
             return
-        op_entry = OP_DATA.get(selected_op, {})
-        cgra_entry = op_entry.get("CGRA", {})
-        explicit_path = cgra_entry.get("config_xml")
+        candidates = _xml_candidates(selected_op)
         xml_text = None
-        candidates = []
-        if explicit_path:
-            # Normalize path separators for cross-platform compatibility
-            explicit_path = explicit_path.replace("/", os.sep).replace("\\", os.sep)
-            
-            # Handle both absolute and relative paths
-            # If relative path starts with ./, resolve it relative to PROJECT_ROOT
-            if explicit_path.startswith("." + os.sep):
-                abs_path = os.path.normpath(os.path.join(PROJECT_ROOT, explicit_path[2:]))
-                candidates.append(abs_path)
-            else:
-                candidates.append(os.path.normpath(explicit_path))
-                # Also try relative to PROJECT_ROOT
-                candidates.append(os.path.normpath(os.path.join(PROJECT_ROOT, explicit_path)))
-        slug = slugify(selected_op)
-        candidates.append(os.path.normpath(os.path.join(PROJECT_ROOT, "op_xml", f"{slug}.xml")))
         for path in candidates:
+            # Opening directly replaces a separate isfile() probe; missing files just fail
             try:
-                if os.path.isfile(path):
-                    with open(path, "r", encoding="utf-8") as xf:
-                        xml_text = xf.read()
-                        break
+                with open(path, "r", encoding="utf-8") as xf:
+                    xml_text = xf.read()
+                    break
             except Exception:
                 xml_text = None
         if xml_text is None:
             tried = "\n".join(candidates)
             xml_text = f"<!-- XML not found for operator: {selected_op} -->\n<!-- Tried paths:\n{tried}\n-->\n"
+        self._set_xml_text(xml_text)
+        
+        # Load the operator's golden model in the background before a run needs it
+        manager = get_golden_manager()
+        if manager:
+            manager.prefetch([self._get_task_name_from_operator(selected_op)])
+
+    def _set_xml_text(self, xml_text: str):
+        """
+        Replace the XML viewer text with the highlighter detached; reattaching it
+        schedules one rehighlight of the new document on the next event loop turn.
+        """
+        self.xml_highlighter.setDocument(None)
         self.op_xml_view.setPlainText(xml_text)
+        self.xml_highlighter.setDocument(self.op_xml_view.document())
 
     # -------------------------------
     # Run simulation
@@ -473,55 +695,31 @@ class PerfSimGUI(QMainWindow):
     def run_simulation(self):
         """
         Update performance table and, if the currently selected arch is CGRA,
-        start the SimulationRunner. Runner callbacks append to cache; UI is updated
-        only if the user still has that operator+arch selected.
+        queue a CGRAValidationJob on _validation_pool. Its output signals append to the
+        cache; UI is updated only if the user still has that operator+arch selected.
         """
         # Do not clear perf_log here because user may be viewing other arch; we preserve current view.
         selected_op = self.operator_combo.currentText()
         selected_arch = self.arch_combo.currentText()
         if not selected_op or not selected_arch:
-            self.perf_log.append("请先选择算子和架构。\n")
+            self.perf_log.appendPlainText("请先选择算子和架构。\n")
             return
 
-        perf_data = OP_DATA[selected_op]
+        perf_data = get_op_data()[selected_op]
 
-        # update perf table
-        self.perf_table.setRowCount(len(perf_data))
-        for i, arch in enumerate(perf_data.keys()):
-            metrics = perf_data[arch]
-            self.perf_table.setItem(i, 0, QTableWidgetItem(arch))
-            
-            # Format numerical values properly using utility functions
-            cycle_val = metrics.get("cycle", 0)
-            throughput_val = metrics.get("throughput", 0)
-            latency_val = metrics.get("latency", 0)
-            power_val = metrics.get("power", 0)
-            efficiency_val = metrics.get("efficiency", 0)
-            density_val = metrics.get("density", 0)
-            
-            # Convert to proper formatted strings
-            self.perf_table.setItem(i, 1, QTableWidgetItem(format_number_with_commas(cycle_val)))
-            self.perf_table.setItem(i, 2, QTableWidgetItem(format_float_precision(throughput_val)))
-            self.perf_table.setItem(i, 3, QTableWidgetItem(format_number_with_commas(latency_val)))
-            self.perf_table.setItem(i, 4, QTableWidgetItem(format_float_precision(power_val)))
-            self.perf_table.setItem(i, 5, QTableWidgetItem(format_float_precision(efficiency_val)))
-            self.perf_table.setItem(i, 6, QTableWidgetItem(format_float_precision(density_val)))
-            
-            # Center align performance table content 
-            for col in range(1, 7):
-                if self.perf_table.item(i, col):
-                    self.perf_table.item(i, col).setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+        # update perf table in a single model reset
+        self.perf_table.model().set_rows(_perf_rows(selected_op))
 
-        # Update charts using modular functions
-        update_bar_chart(self.bar_ax, self.bar_canvas, perf_data)
-        update_radar_chart(self.radar_ax, self.radar_canvas, perf_data)
+        # Update charts using modular functions; unbuilt tabs pick this up when first shown
+        self._chart_data = perf_data
+        self._update_charts()
 
         # log and run simulation
-        self.perf_log.append(f"正在运行仿真: {selected_op} (架构: {selected_arch})\n")
+        self.perf_log.appendPlainText(f"正在运行仿真: {selected_op} (架构: {selected_arch})\n")
         metrics = perf_data[selected_arch]
 
         if selected_arch == "CGRA":
-            # Start CGRA simulation via CGRAValidationThread.
+            # Start CGRA simulation via CGRAValidationJob.
             # Callbacks will append lines to cache and update UI only when current selection matches.
             key = cache_key(selected_op, selected_arch)
 
@@ -530,7 +728,7 @@ class PerfSimGUI(QMainWindow):
 
             # ensure cache entry exists so UI shows incremental logs
             if key not in self.log_cache:
-                self.log_cache[key] = ""
+                self.log_cache[key] = []
 
             # Extract task name from config_xml path or use operator name
             config_xml_path = metrics.get("config_xml", "")
@@ -538,118 +736,93 @@ class PerfSimGUI(QMainWindow):
             # You may need to adjust this mapping based on your actual task names
             task_name = self._get_task_name_from_operator(selected_op)
             
-            # Create validation thread
+            # Create validation job
             # resource_dir parameter will point to data folder, and defaults will be used for input/output
-            thread = CGRAValidationThread(
+            job = CGRAValidationJob(
                 task=task_name,
                 resource_dir=os.path.join(PROJECT_ROOT, "data")
             )
             
-            # define callbacks that append to cache and update UI only if still selected
-            def stdout_callback(line: str, _op=selected_op, _arch=selected_arch):
-                k = cache_key(_op, _arch)
-                # append to cache
-                self._append_to_log_cache(k, line)
-                # update UI only if user currently views this operator+arch
-                if self.operator_combo.currentText() == _op and self.arch_combo.currentText() == _arch:
-                    # replace entire text with cached content (keeps UI consistent)
-                    self.perf_log.clear()
-                    self.perf_log.append(self.log_cache[k])
-                    self.perf_log.verticalScrollBar().setValue(self.perf_log.verticalScrollBar().maximum())
-
-            def stderr_callback(line: str, _op=selected_op, _arch=selected_arch):
+            # define callbacks that append to cache and update UI only if still selected;
+            # the key is bound once here instead of being rebuilt for every output line
+            def stdout_callback(line: str, _key=key):
+                # append to cache; UI is updated in batches only if user views this operator+arch
+                self._queue_log_line(_key, line)
+
+            def stderr_callback(line: str, _key=key):
                 # treat stderr similarly (prefix with [ERR])
-                out_line = f"[ERR] {line}"
-                k = cache_key(_op, _arch)
-                self._append_to_log_cache(k, out_line)
-                if self.operator_combo.currentText() == _op and self.arch_combo.currentText() == _arch:
-                    self.perf_log.clear()
-                    self.perf_log.append(self.log_cache[k])
-                    self.perf_log.verticalScrollBar().setValue(self.perf_log.verticalScrollBar().maximum())
-
-            def finished_callback(success: bool, _op=selected_op, _arch=selected_arch):
-                k = cache_key(_op, _arch)
+                self._queue_log_line(_key, f"[ERR] {line}")
+
+            def finished_callback(success: bool, k=key):
                 result_msg = "[Validation Passed]" if success else "[Validation Failed]"
-                self._append_to_log_cache(k, result_msg)
+                self._queue_log_line(k, result_msg)
                 # remove running marker
                 try:
                     self.running_runners.remove(k)
-                    if k in self.validation_threads:
-                        del self.validation_threads[k]
+                    self.validation_jobs.pop(k, None)
                 except KeyError:
                     pass
-                # update UI only if user still views this operator+arch
-                if self.operator_combo.currentText() == _op and self.arch_combo.currentText() == _arch:
-                    self.perf_log.clear()
-                    self.perf_log.append(self.log_cache[k])
-                    self.perf_log.verticalScrollBar().setValue(self.perf_log.verticalScrollBar().maximum())
 
             # Connect signals
-            thread.stdout_signal.connect(stdout_callback)
-            thread.stderr_signal.connect(stderr_callback)
-            thread.finished_signal.connect(finished_callback)
+            job.signals.stdout_signal.connect(stdout_callback)
+            job.signals.stderr_signal.connect(stderr_callback)
+            job.signals.finished_signal.connect(finished_callback)
+            job.signals.done.connect(self._live_jobs.discard)
             
-            # Store thread reference and start
-            self.validation_threads[key] = thread
-            thread.start()
+            # Store job reference and queue it
+            self.validation_jobs[key] = job
+            self._live_jobs.add(job)
+            self._validation_pool.start(job)
         else:
             # Non-CGRA: logs are handled immediately in update_log_view when arch selection changes.
             # Here we simply ensure the log for the selected arch is loaded into cache and UI.
             key = cache_key(selected_op, selected_arch)
-            metrics = perf_data[selected_arch]
-            log_path = metrics.get("log_path", "")
-            if log_path:
-                # Handle relative paths - normalize and resolve relative to project root
-                if log_path.startswith("./"):
-                    # Remove ./ prefix and resolve relative to PROJECT_ROOT
-                    resolved_path = os.path.normpath(os.path.join(PROJECT_ROOT, log_path[2:]))
-                elif os.path.isabs(log_path):
-                    # Already absolute path
-                    resolved_path = os.path.normpath(log_path)
-                else:
-                    # Relative path without ./, resolve relative to PROJECT_ROOT
-                    resolved_path = os.path.normpath(os.path.join(PROJECT_ROOT, log_path))
-                
-                if os.path.isfile(resolved_path):
-                    try:
-                        with open(resolved_path, "r", encoding="utf-8") as lf:
-                            content = lf.read()
-                        self.log_cache[key] = content
-                        # Only update UI if user still viewing this operator+arch
-                        if self.operator_combo.currentText() == selected_op and self.arch_combo.currentText() == selected_arch:
-                            self.perf_log.clear()
-                            self.perf_log.append(content)
-                    except Exception as e:
-                        self.perf_log.append(f"[{selected_arch}] Error reading log file '{resolved_path}': {e}\n")
-                else:
-                    self.perf_log.append(f"[{selected_arch}] Log file not found: {resolved_path}\n")
-            else:
-                self.perf_log.append(f"[{selected_arch}] No log path specified in configuration.\n")
+            if key in self.log_cache:
+                self._show_cached_log(key)
+            self._request_log_read(key, selected_arch, perf_data[selected_arch])
 
     # -------------------------------
     # Clear all runtime outputs
     # -------------------------------
     def clear_all(self):
         """Clear GUI runtime outputs and caches related to logs."""
+        self._log_flush_timer.stop()
+        self._ui_offset.clear()
         self.perf_log.clear()
         self.op_xml_view.clear()
-        self.perf_table.clearContents()
-        self.bar_ax.clear()
-        self.bar_canvas.draw()
-        self.radar_ax.clear()
-        self.radar_canvas.draw()
+        self.perf_table.model().clear_contents()
+        self._chart_data = None
+        if self.bar_blitter is not None:
+            self.bar_ax.clear()
+            self.bar_blitter.reset()
+            self.bar_canvas.draw_idle()
+        if self.radar_blitter is not None:
+            self.radar_ax.clear()
+            self.radar_blitter.reset()
+            self.radar_canvas.draw_idle()
         # Clear caches and running markers
         self.log_cache.clear()
+        self._packed_logs.clear()
+        self._log_seen.clear()
         self.running_runners.clear()
-        # Stop and clear any running validation threads
-        for thread in self.validation_threads.values():
-            if thread.isRunning():
-                thread.stop()
-                thread.wait(1000)  # Wait up to 1 second for thread to finish
-        self.validation_threads.clear()
-
+        # Drop queued validation jobs; ask the running one to stop, it finishes in the background
+        for job in self.validation_jobs.values():
+            if self._validation_pool.tryTake(job):
+                # Never runs, so done never comes
+                self._live_jobs.discard(job)
+            else:
+                job.request_stop()
+            # Drop output already queued for the old log as well
+            job.signals.stdout_signal.disconnect()
+            job.signals.stderr_signal.disconnect()
+            job.signals.finished_signal.disconnect()
+        self.validation_jobs.clear()
 
 if __name__ == "__main__":
+    if getattr(sys, "frozen", False):
+        # Packaged builds: let spawned golden-model batch workers start up
+        import multiprocessing
+        multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     gui = PerfSimGUI()
     gui.show()
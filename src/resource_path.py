@@ -6,8 +6,14 @@ Provides utility functions to get correct resource paths in both development and
 
 import os
 import sys
+from functools import lru_cache
 
+# PyInstaller creates a temp folder and stores its path in sys._MEIPASS before any
+# module is imported; in development, use the project root (parent of src/)
+_BASE_PATH = getattr(sys, '_MEIPASS', None) or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+
+@lru_cache(maxsize=256)
 def get_resource_path(relative_path=""):
     """
     Get absolute path to resource, works for dev and for PyInstaller.
@@ -21,16 +27,9 @@ def get_resource_path(relative_path=""):
     Returns:
         Absolute path to the resource
     """
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        # In development, use the project root (parent of src/)
-        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    
     if relative_path:
-        return os.path.join(base_path, relative_path)
-    return base_path
+        return os.path.join(_BASE_PATH, relative_path)
+    return _BASE_PATH
 
 
 def get_project_root():
@@ -41,11 +40,13 @@ def get_project_root():
     return get_resource_path("")
 
 
+@lru_cache(maxsize=256)
 def get_config_path(filename):
     """Get path to a config file."""
     return get_resource_path(os.path.join("config", filename))
 
 
+@lru_cache(maxsize=256)
 def get_data_path(filename=""):
     """Get path to a data file or data directory."""
     if filename:
@@ -53,6 +54,7 @@ def get_data_path(filename=""):
     return get_resource_path("data")
 
 
+@lru_cache(maxsize=256)
 def get_bin_path(filename):
     """Get path to a binary executable."""
     return get_resource_path(os.path.join("bin", filename))
@@ -2,13 +2,17 @@
 """
 sim_runner.py
 Encapsulates an external script runner
-- Supports real-time stdout/stderr output via callbacks
+- Supports real-time output via callbacks (stderr is merged into stdout;
+  lines the script prefixes with [ERR] are routed to the stderr callback)
 - Supports finished callback
 """
 
 import os
 from PyQt6.QtCore import QProcess
 
+# Merged output lines starting with this are error output (scripts write it in front of stderr lines)
+ERROR_PREFIX = "[ERR]"
+
 class SimulationRunner:
     def __init__(self, script_dir="./sim_scripts"):
         """
@@ -19,6 +23,8 @@ class SimulationRunner:
         self.stdout_callback = None
         self.stderr_callback = None
         self.finished_callback = None
+        # Bytes received after the last newline, kept until the line is complete
+        self._stdout_buf = bytearray()
 
     def run(self, script_name, args=None,
             stdout_callback=None, stderr_callback=None, finished_callback=None):
@@ -26,8 +32,10 @@ class SimulationRunner:
         Start running the script
         :param script_name: Name of the script, e.g., run_sim.py
         :param args: list of arguments to pass to the script, e.g., ["Conv2d W=224 H=224"]
-        :param stdout_callback: callback(str), called on each stdout output
-        :param stderr_callback: callback(str), called on each stderr output
+        :param stdout_callback: callback(str), called with each batch of complete output lines
+            (stdout and stderr interleaved in the order the script wrote them)
+        :param stderr_callback: callback(str), called with each batch of lines starting with
+            ERROR_PREFIX; without it those lines go to stdout_callback as well
         :param finished_callback: callback(), called when the script finishes
         """
         if args is None:
@@ -36,29 +44,63 @@ class SimulationRunner:
         self.stdout_callback = stdout_callback
         self.stderr_callback = stderr_callback
         self.finished_callback = finished_callback
+        self._stdout_buf.clear()
 
         self.process = QProcess()
+        # One pipe and one readyRead signal for both streams
+        self.process.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
         self.process.setWorkingDirectory(self.script_dir)
         self.process.readyReadStandardOutput.connect(self.handle_stdout)
-        self.process.readyReadStandardError.connect(self.handle_stderr)
         self.process.finished.connect(self.handle_finished)
 
         # Start the process
         self.process.start("python", [script_name] + args)
 
-    def handle_stdout(self):
-        if self.process:
-            data = self.process.readAllStandardOutput().data().decode()
-            if self.stdout_callback and data.strip():
-                self.stdout_callback(data.strip())
+    @staticmethod
+    def _take_lines(buf: bytearray, data: bytes, final: bool = False) -> str:
+        """
+        Append data to buf and remove and return the complete lines in it.
+        Lines are decoded in one pass and joined with newlines; with final=True
+        a trailing partial line is returned as well.
+        """
+        buf += data
+        if final:
+            end = len(buf)
+            # A terminated last line is complete too; its newline is not part of the text
+            if buf.endswith(b"\n"):
+                end -= 1
+        else:
+            end = buf.rfind(b"\n")
+            if end < 0:
+                return ""
+        lines = buf[:end].decode("utf-8", errors="replace").split("\n")
+        del buf[:end + 1]
+        return "\n".join(line.rstrip("\r") for line in lines)
+
+    def _deliver(self, text: str):
+        """Pass a batch of lines to the callbacks, splitting off [ERR] lines when stderr_callback is set."""
+        if not text.strip():
+            return
+        # The channels are merged, so error lines are recognized by the prefix the script writes
+        if self.stderr_callback and ERROR_PREFIX in text:
+            lines = text.split("\n")
+            errors = [line for line in lines if line.startswith(ERROR_PREFIX)]
+            text = "\n".join(line for line in lines if not line.startswith(ERROR_PREFIX))
+            self.stderr_callback("\n".join(errors))
+            if not text.strip():
+                return
+        if self.stdout_callback:
+            self.stdout_callback(text)
 
-    def handle_stderr(self):
+    def handle_stdout(self):
         if self.process:
-            data = self.process.readAllStandardError().data().decode()
-            if self.stderr_callback and data.strip():
-                self.stderr_callback(data.strip())
+            self._deliver(self._take_lines(self._stdout_buf, self.process.readAllStandardOutput().data()))
 
     def handle_finished(self):
+        # Deliver whatever is left, including a last line without a trailing newline
+        if self.process:
+            self._deliver(self._take_lines(self._stdout_buf, self.process.readAllStandardOutput().data(),
+                                           final=True))
         if self.finished_callback:
             self.finished_callback()
         self.process = None
@@ -1,21 +1,36 @@
 # -*- coding: utf-8 -*-
 """
 CGRA Validation Thread
-Provides a QThread wrapper for running CGRA validation without blocking the UI.
+Provides thread pool tasks for running CGRA validation without blocking the UI
+and for reading log files off the UI thread.
 """
 
-from PyQt6.QtCore import QThread, pyqtSignal
-from validator import run_validation
+import codecs
+import os
+import threading
+from functools import lru_cache
 
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+from validator import run_validation, terminate_child_processes
 
-class CGRAValidationThread(QThread):
+
+class CGRAValidationSignals(QObject):
+    """Signals of CGRAValidationJob (QRunnable cannot declare signals itself)."""
+    # Typed object, not str: a batch of output (up to OUTPUT_READ_SIZE bytes) then crosses
+    # threads as a reference instead of being converted to a QString and back
+    stdout_signal = pyqtSignal(object)
+    stderr_signal = pyqtSignal(object)
+    finished_signal = pyqtSignal(bool)  # True if validation passed, False otherwise
+    # Emitted last by every run(), also after request_stop, with the job; the job is not
+    # auto-deleted, so the owner keeps a reference until this arrives
+    done = pyqtSignal(object)
+
+
+class CGRAValidationJob(QRunnable):
     """
-    Thread for running CGRA validation in the background.
-    Emits signals for stdout, stderr, and completion.
+    Thread pool task for running CGRA validation in the background.
+    Emits signals for stdout, stderr, and completion through self.signals.
     """
-    stdout_signal = pyqtSignal(str)
-    stderr_signal = pyqtSignal(str)
-    finished_signal = pyqtSignal(bool)  # True if validation passed, False otherwise
     
     def __init__(self, task: str, input_dir: str = None,
                  output_dir: str = None, resource_dir: str = None):
@@ -24,25 +39,120 @@ class CGRAValidationThread(QThread):
         self.input_dir = input_dir
         self.output_dir = output_dir
         self.resource_dir = resource_dir
-        self._is_running = True
+        self.signals = CGRAValidationSignals()
+        # The owner releases the job on signals.done; auto-deletion would delete it under
+        # a Python reference the owner may still use (request_stop, tryTake)
+        self.setAutoDelete(False)
+        # Set from the UI thread by request_stop(); doubles as run_validation's cancel event
+        self._stop_requested = threading.Event()
     
     def run(self):
-        """Run the validation in a separate thread."""
+        """Run the validation on a pool thread."""
         try:
             success = run_validation(
                 self.task,
                 self.input_dir,
                 self.output_dir,
                 self.resource_dir,
-                stdout_callback=self.stdout_signal.emit,
-                stderr_callback=self.stderr_signal.emit
+                stdout_callback=self._emit_stdout,
+                stderr_callback=self._emit_stderr,
+                cancel_event=self._stop_requested
             )
-            self.finished_signal.emit(success)
+            if not self._stop_requested.is_set():
+                self.signals.finished_signal.emit(success)
         except Exception as e:
-            self.stderr_signal.emit(f"Thread error: {str(e)}")
-            self.finished_signal.emit(False)
+            self._emit_stderr(f"Thread error: {str(e)}")
+            if not self._stop_requested.is_set():
+                self.signals.finished_signal.emit(False)
+        finally:
+            self.signals.done.emit(self)
+
+    def _emit_stdout(self, line: str):
+        if not self._stop_requested.is_set():
+            self.signals.stdout_signal.emit(line)
+
+    def _emit_stderr(self, line: str):
+        if not self._stop_requested.is_set():
+            self.signals.stderr_signal.emit(line)
     
-    def stop(self):
-        """Request the thread to stop (note: actual stopping depends on subprocess)."""
-        self._is_running = False
-        self.terminate()
+    def request_stop(self):
+        """
+        Request cancellation without blocking the caller.
+        Nothing more is emitted and no further step or child process is started; a
+        running simulator or golden model subprocess of this job is terminated (killed
+        after a grace period) so its step fails fast, while an in-process golden model
+        winds down in the background. signals.done still arrives once run() returns.
+        """
+        # Set before terminating: a child started concurrently is then either refused or reached
+        self._stop_requested.set()
+        terminate_child_processes(self._stop_requested)
+
+
+def _decode_log(data: bytes):
+    """
+    Return (text, byte length) of raw log data, with the newline handling of text mode.
+    The length only covers what was decoded: a UTF-8 character cut off at the end, or a
+    final \r that may be the first half of \r\n, is left for the next read from there.
+    """
+    end = len(data)
+    if data.endswith(b"\r"):
+        end -= 1
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    text = decoder.decode(data[:end])
+    # Bytes of an incomplete trailing character the decoder is still holding
+    end -= len(decoder.getstate()[0])
+    return text.replace("\r\n", "\n").replace("\r", "\n"), end
+
+
+@lru_cache(maxsize=64)
+def _read_log(path: str, mtime_ns: int, size: int):
+    """
+    Read the first size bytes of a log file as (text, byte length). Keyed by the
+    file's mtime and size, so a rewritten file is read again.
+    """
+    with open(path, "rb") as lf:
+        return _decode_log(lf.read(size))
+
+
+class LogReaderSignals(QObject):
+    """Signals of LogFileReader (QRunnable cannot declare signals itself)."""
+    finished = pyqtSignal(str, str, int, int)  # key, text, start offset, end offset
+    failed = pyqtSignal(str, str)  # key, error message
+
+
+class LogFileReader(QRunnable):
+    """
+    Thread pool task that reads a log file from a byte offset to its end.
+    Emits finished with the new text and the byte range it covers; when the file
+    shrank since the last read it is read again from the start (start offset 0).
+    """
+    
+    def __init__(self, key: str, path: str, offset: int = 0):
+        super().__init__()
+        self.key = key
+        self.path = path
+        self.offset = offset
+        self.signals = LogReaderSignals()
+    
+    def run(self):
+        """Read the unseen tail of the log file."""
+        try:
+            st = os.stat(self.path)
+            size = st.st_size
+            # Unchanged since the last read: nothing to do
+            if size == self.offset:
+                return
+            if 0 < self.offset < size:
+                start = self.offset
+                with open(self.path, "rb") as lf:
+                    lf.seek(start)
+                    text, length = _decode_log(lf.read())
+            else:
+                # Whole-file reads are memoized, e.g. for logs viewed again after clearing
+                start = 0
+                text, length = _read_log(self.path, st.st_mtime_ns, size)
+            self.signals.finished.emit(self.key, text, start, start + length)
+        except FileNotFoundError:
+            self.signals.failed.emit(self.key, f"Log file not found: {self.path}")
+        except Exception as e:
+            self.signals.failed.emit(self.key, f"Error reading log file '{self.path}': {e}")
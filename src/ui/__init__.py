@@ -5,8 +5,9 @@ Contains all UI-related components including styles, charts, and syntax highligh
 """
 
 from .styles import APP_STYLESHEET, CHART_BACKGROUND_COLOR
-from .charts import update_bar_chart, update_radar_chart, setup_chart_style
+from .charts import update_bar_chart, update_radar_chart, setup_chart_style, BarChartBlitter, RadarChartBlitter
 from .xml_highlighter import XmlSyntaxHighlighter
+from .tables import TextTableModel
 
 __all__ = [
     'APP_STYLESHEET',
@@ -14,5 +15,8 @@ __all__ = [
     'update_bar_chart',
     'update_radar_chart',
     'setup_chart_style',
-    'XmlSyntaxHighlighter'
+    'BarChartBlitter',
+    'RadarChartBlitter',
+    'XmlSyntaxHighlighter',
+    'TextTableModel'
 ]
@@ -4,21 +4,39 @@ Charts Module
 Contains functions for creating and updating bar charts and radar charts.
 """
 
-import math
 import numpy as np
-import matplotlib.pyplot as plt
 from .styles import WARM_COLORS, WARM_RADAR_COLORS, CHART_BACKGROUND_COLOR
 
 
-def update_bar_chart(bar_ax, bar_canvas, perf_data):
-    """Update the bar chart with performance data."""
-    bar_ax.clear()
+BAR_METRICS_KEYS = ["throughput", "latency", "power", "efficiency", "density"]
+BAR_METRICS_LABELS = ["吞吐量 (GOPS)", "延迟 (ns)", "功耗 (W)", "能效 (GOPS/W)", "有效算力密度 (MOPS/mm$^2$)"]
+# x-axis represents metrics; an ndarray because bar positions are broadcast against
+# the per-architecture offsets in _render_bar_chart
+BAR_X_POSITIONS = np.arange(len(BAR_METRICS_KEYS))
+# Column of latency in the value arrays (lower is better, so its ratio is inverted)
+LATENCY_INDEX = BAR_METRICS_KEYS.index("latency")
+# Metric angles of the radar chart, repeated at the end to close the polygon
+RADAR_ANGLES = np.linspace(0, 2 * np.pi, len(BAR_METRICS_KEYS), endpoint=False).tolist()
+RADAR_ANGLES += RADAR_ANGLES[:1]
+
+
+def _metric_array(perf_data, archs, keys):
+    """
+    Collect metrics into an (archs x keys) float array.
+    Missing or empty values count as 1, non-positive values are clamped to 1e-3.
+    """
+    raw = np.array([[float(perf_data[arch].get(key, 1) or 1) for key in keys] for arch in archs],
+                   dtype=np.float64)
+    return np.where(raw > 0, raw, 1e-3)
+
+
+def _normalize_bar_values(perf_data):
+    """
+    Normalize performance data against the Xeon (or first) architecture.
+    Returns (archs, baseline_arch, values) where values is an (archs x metrics)
+    array of normalized metrics in BAR_METRICS_KEYS order.
+    """
     archs = list(perf_data.keys())
-    metrics_keys = ["throughput", "latency", "power", "efficiency", "density"]
-    metrics_labels = ["吞吐量 (GOPS)", "延迟 (ns)", "功耗 (W)", "能效 (GOPS/W)", "有效算力密度 (MOPS/mm$^2$)"]
-    num_archs = len(archs)
-    x = np.arange(len(metrics_keys))  # Now x-axis represents metrics
-    width = 0.8 / num_archs  # Adjust width based on number of architectures
 
     # Find Xeon baseline values for normalization
     xeon_baseline = None
@@ -31,38 +49,36 @@ def update_bar_chart(bar_ax, bar_canvas, perf_data):
     if xeon_baseline is None:
         xeon_baseline = archs[0]
     
-    # Get baseline values
-    baseline_values = {}
-    for key in metrics_keys:
-        v = perf_data[xeon_baseline].get(key, 1)
-        val = float(v) if v else 1.0
-        if val <= 0: val = 1e-3
-        baseline_values[key] = val
+    raw = _metric_array(perf_data, archs, BAR_METRICS_KEYS)
+    baseline_values = raw[archs.index(xeon_baseline)]
+
+    # Normalize relative to Xeon baseline; higher is better for all metrics but latency
+    values = raw / baseline_values
+    values[:, LATENCY_INDEX] = baseline_values[LATENCY_INDEX] / raw[:, LATENCY_INDEX]
+
+    return archs, xeon_baseline, values
+
 
+def _render_bar_chart(bar_ax, archs, xeon_baseline, values, animated=False):
+    """Draw the full bar chart into bar_ax and return the bar rectangles per architecture."""
+    bar_ax.clear()
+    num_archs = len(archs)
+    x = BAR_X_POSITIONS
+    width = 0.8 / num_archs  # Adjust width based on number of architectures
+
+    # Position bars for each architecture within each metric group
+    offsets = (np.arange(num_archs) - num_archs/2) * width + width/2
+    positions = x[None, :] + offsets[:, None]
+
+    bars = []
     for idx, arch in enumerate(archs):
-        normalized_values = []
-        for key in metrics_keys:
-            v = perf_data[arch].get(key, 1)
-            val = float(v) if v else 1.0
-            if val <= 0: val = 1e-3
-            
-            # Normalize relative to Xeon baseline
-            if key == 'latency':
-                # For latency, lower is better, so we invert the ratio
-                normalized_val = baseline_values[key] / val
-            else:
-                # For other metrics, higher is better
-                normalized_val = val / baseline_values[key]
-            
-            normalized_values.append(normalized_val)
-        
-        # Position bars for each architecture within each metric group
-        bar_ax.bar(x + (idx - num_archs/2) * width + width/2, normalized_values, width, 
-                   label=arch, color=WARM_COLORS[idx % len(WARM_COLORS)], 
-                   alpha=0.8, edgecolor='white', linewidth=1)
+        container = bar_ax.bar(positions[idx], values[idx], width, 
+                               label=arch, color=WARM_COLORS[idx % len(WARM_COLORS)], 
+                               alpha=0.8, edgecolor='white', linewidth=1, animated=animated)
+        bars.append(list(container))
 
     bar_ax.set_xticks(x)
-    bar_ax.set_xticklabels(metrics_labels, fontweight='bold', color='#2c3e50', rotation=15, ha='right')
+    bar_ax.set_xticklabels(BAR_METRICS_LABELS, fontweight='bold', color='#2c3e50', rotation=15, ha='right')
     bar_ax.set_ylabel(f"相对性能 (以{xeon_baseline}为基准)", fontweight='bold', color='#2c3e50')
     bar_ax.set_yscale("log")
     
@@ -72,82 +88,125 @@ def update_bar_chart(bar_ax, bar_canvas, perf_data):
     bar_ax.legend(fontsize=8, frameon=True, fancybox=True, shadow=True, title='架构')
     bar_ax.grid(True, alpha=0.3, color='#bdc3c7')
     bar_ax.set_title(f"性能对比（归一化）", fontweight='bold', color='#e67e22', fontsize=14)
-    bar_canvas.draw()
+    return bars
 
 
-def update_radar_chart(radar_ax, radar_canvas, perf_data):
-    """Update the radar chart with performance data."""
+def update_bar_chart(bar_ax, bar_canvas, perf_data):
+    """Update the bar chart with performance data."""
+    archs, xeon_baseline, values = _normalize_bar_values(perf_data)
+    _render_bar_chart(bar_ax, archs, xeon_baseline, values)
+    bar_canvas.draw_idle()
+
+
+class BarChartBlitter:
+    """
+    Blitting manager for the bar chart.
+    Bars are animated artists drawn over a cached background (axes, ticks, legend, grid),
+    so re-running an operator with the same architecture layout only repaints the bars.
+    """
+
+    def __init__(self, bar_ax, bar_canvas):
+        self.bar_ax = bar_ax
+        self.bar_canvas = bar_canvas
+        self.background = None
+        self.bars = []
+        self.layout = None  # (archs, baseline arch) of the last full render
+        # Every full draw (first render, resize, clear) refreshes the cached background
+        self.bar_canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _on_draw(self, event):
+        """Capture the static background and paint the animated bars on top of it."""
+        self.background = self.bar_canvas.copy_from_bbox(self.bar_ax.bbox)
+        self._draw_bars()
+
+    def _draw_bars(self):
+        for arch_bars in self.bars:
+            for bar in arch_bars:
+                self.bar_ax.draw_artist(bar)
+
+    def _fits_ylim(self, values):
+        ymin, ymax = self.bar_ax.get_ylim()
+        return ymin <= values.min() and values.max() <= ymax
+
+    def update(self, perf_data):
+        """Update the bar chart, blitting bar heights when the layout is unchanged."""
+        archs, xeon_baseline, values = _normalize_bar_values(perf_data)
+        layout = (archs, xeon_baseline)
+
+        if (self.background is None or layout != self.layout
+                or not self._fits_ylim(values)):
+            self.bars = _render_bar_chart(self.bar_ax, archs, xeon_baseline, values, animated=True)
+            self.layout = layout
+            # The pending draw_event captures a fresh background; never blit onto the stale one
+            self.background = None
+            self.bar_canvas.draw_idle()
+            return
+
+        for arch_bars, arch_values in zip(self.bars, values):
+            for bar, val in zip(arch_bars, arch_values):
+                bar.set_height(val)
+        self.bar_canvas.restore_region(self.background)
+        self._draw_bars()
+        self.bar_canvas.blit(self.bar_ax.bbox)
+
+    def reset(self):
+        """Forget the bar artists after the axes have been cleared."""
+        self.bars = []
+        self.layout = None
+        self.background = None
+
+
+def _normalize_radar_values(perf_data):
+    """
+    Scale each metric of each architecture into the 0.1-1.0 radar range.
+    Returns (archs, values) where values[i] is the closed polygon of archs[i]
+    (first point repeated at the end) in BAR_METRICS_KEYS order.
+    """
+    archs = list(perf_data.keys())
+    raw = _metric_array(perf_data, archs, BAR_METRICS_KEYS)
+
+    # Normalization range per metric, padded by 20% on both sides to avoid clustering
+    min_vals = raw.min(axis=0)
+    max_vals = raw.max(axis=0)
+    range_vals = max_vals - min_vals
+    padding = range_vals * 0.2
+    lower = min_vals - padding
+    upper = max_vals + padding
+    spans = range_vals + 2 * padding
+    # Handle metrics where all values are the same
+    flat = range_vals == 0
+    lower[flat] = min_vals[flat] - 0.1
+    upper[flat] = max_vals[flat] + 0.1
+    spans[flat] = 0.2
+
+    # Higher is better except for latency, whose scale is inverted
+    normalized = (raw - lower) / spans
+    normalized[:, LATENCY_INDEX] = (upper[LATENCY_INDEX] - raw[:, LATENCY_INDEX]) / spans[LATENCY_INDEX]
+
+    # Scale to 0.1-1.0 range to avoid center clustering and ensure visibility
+    scaled = 0.1 + normalized * 0.9
+
+    # Close the polygons
+    return archs, np.concatenate((scaled, scaled[:, :1]), axis=1)
+
+
+def _render_radar_chart(radar_ax, archs, values, animated=False):
+    """Draw the full radar chart into radar_ax and return (line, fill polygon) per architecture."""
     radar_ax.clear()
-    metrics = ["吞吐量 (GOPS)", "延迟 (ns)", "功耗 (W)", "能效 (GOPS/W)", "有效算力密度 (MOPS/mm$^2$)"]
-    keys = ["throughput", "latency", "power", "efficiency", "density"]
-    angles = np.linspace(0, 2 * np.pi, len(metrics), endpoint=False).tolist()
-    angles += angles[:1]
-    
-    # Collect all raw values for normalization
-    all_raw_values = {key: [] for key in keys}
-    for arch in perf_data:
-        for k in keys:
-            v = perf_data[arch].get(k, 1)
-            vv = float(v) if v else 1.0
-            if vv <= 0: vv = 1e-3
-            all_raw_values[k].append(vv)
-    
-    # Calculate normalization parameters for each metric
-    norm_params = {}
-    for k in keys:
-        values = all_raw_values[k]
-        min_val = min(values)
-        max_val = max(values)
-        
-        # Add some padding to avoid clustering
-        range_val = max_val - min_val
-        if range_val == 0:  # Handle case where all values are the same
-            norm_params[k] = {'min': min_val - 0.1, 'max': max_val + 0.1, 'range': 0.2}
-        else:
-            # Add 20% padding on both sides for better visualization
-            padding = range_val * 0.2
-            norm_params[k] = {
-                'min': min_val - padding,
-                'max': max_val + padding,
-                'range': range_val + 2 * padding
-            }
-    
-    # Special handling for latency (lower is better, so we need to invert)
-    latency_values = all_raw_values['latency']
-    if latency_values:
-        max_latency = max(latency_values)
-        # For latency, we'll use (max_latency + padding - current_value) for normalization
-        
-    for idx, arch in enumerate(perf_data):
-        normalized_vals = []
-        for i, k in enumerate(keys):
-            v = perf_data[arch].get(k, 1)
-            vv = float(v) if v else 1.0
-            if vv <= 0: vv = 1e-3
-            
-            # Normalize to 0-1 range with improved scaling
-            if k == 'latency':
-                # For latency, lower is better - invert the scale
-                max_latency_with_padding = norm_params[k]['max']
-                normalized_val = (max_latency_with_padding - vv) / norm_params[k]['range']
-            else:
-                # For other metrics, higher is better
-                normalized_val = (vv - norm_params[k]['min']) / norm_params[k]['range']
-            
-            # Scale to 0.1-1.0 range to avoid center clustering and ensure visibility
-            scaled_val = 0.1 + normalized_val * 0.9
-            normalized_vals.append(scaled_val)
-        
-        normalized_vals += normalized_vals[:1]  # Close the polygon
-        
+    angles = RADAR_ANGLES
+
+    shapes = []
+    for idx, arch in enumerate(archs):
         color = WARM_RADAR_COLORS[idx % len(WARM_RADAR_COLORS)]
-        radar_ax.plot(angles, normalized_vals, label=arch, color=color, linewidth=2.5, alpha=0.8)
-        radar_ax.fill(angles, normalized_vals, alpha=0.15, color=color)
+        line, = radar_ax.plot(angles, values[idx], label=arch, color=color, linewidth=2.5, alpha=0.8,
+                              animated=animated)
+        fill, = radar_ax.fill(angles, values[idx], alpha=0.15, color=color, animated=animated)
+        shapes.append((line, fill))
 
     # Set consistent radial limits
     radar_ax.set_ylim(0, 1)
     radar_ax.set_xticks(angles[:-1])
-    radar_ax.set_xticklabels(metrics, color='#2c3e50', fontweight='bold', fontsize=9)
+    radar_ax.set_xticklabels(BAR_METRICS_LABELS, color='#2c3e50', fontweight='bold', fontsize=9)
     
     # Add radial grid lines
     radar_ax.set_yticks([0.2, 0.4, 0.6, 0.8, 1.0])
@@ -159,7 +218,67 @@ def update_radar_chart(radar_ax, radar_canvas, perf_data):
                     frameon=True, fancybox=True, shadow=True, title='架构')
     radar_ax.set_title("性能雷达图 (归一化)", fontweight='bold', color='#e67e22', 
                        fontsize=14, pad=20)
-    radar_canvas.draw()
+    return shapes
+
+
+def update_radar_chart(radar_ax, radar_canvas, perf_data):
+    """Update the radar chart with performance data."""
+    archs, values = _normalize_radar_values(perf_data)
+    _render_radar_chart(radar_ax, archs, values)
+    radar_canvas.draw_idle()
+
+
+class RadarChartBlitter:
+    """
+    Blitting manager for the radar chart.
+    Lines and fills are animated artists drawn over a cached background (grid, labels,
+    legend); values always lie in the fixed 0-1 radial range, so only a change of the
+    architecture set needs a full render.
+    """
+
+    def __init__(self, radar_ax, radar_canvas):
+        self.radar_ax = radar_ax
+        self.radar_canvas = radar_canvas
+        self.background = None
+        self.shapes = []
+        self.archs = None  # architectures of the last full render
+        # Every full draw (first render, resize, clear) refreshes the cached background
+        self.radar_canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _on_draw(self, event):
+        """Capture the static background and paint the animated shapes on top of it."""
+        self.background = self.radar_canvas.copy_from_bbox(self.radar_ax.bbox)
+        self._draw_shapes()
+
+    def _draw_shapes(self):
+        for line, fill in self.shapes:
+            self.radar_ax.draw_artist(fill)
+            self.radar_ax.draw_artist(line)
+
+    def update(self, perf_data):
+        """Update the radar chart, blitting new polygons when the architectures are unchanged."""
+        archs, values = _normalize_radar_values(perf_data)
+
+        if self.background is None or archs != self.archs:
+            self.shapes = _render_radar_chart(self.radar_ax, archs, values, animated=True)
+            self.archs = archs
+            # The pending draw_event captures a fresh background; never blit onto the stale one
+            self.background = None
+            self.radar_canvas.draw_idle()
+            return
+
+        for (line, fill), arch_values in zip(self.shapes, values):
+            line.set_data(RADAR_ANGLES, arch_values)
+            fill.set_xy(np.column_stack((RADAR_ANGLES, arch_values)))
+        self.radar_canvas.restore_region(self.background)
+        self._draw_shapes()
+        self.radar_canvas.blit(self.radar_ax.bbox)
+
+    def reset(self):
+        """Forget the radar artists after the axes have been cleared."""
+        self.shapes = []
+        self.archs = None
+        self.background = None
 
 
 def setup_chart_style(fig, ax):
@@ -4,6 +4,8 @@ GUI Styles Module
 Contains all CSS styling definitions for the application.
 """
 
+import re
+
 # Application-wide CSS styles with warm color scheme
 APP_STYLESHEET = """
     QMainWindow {
@@ -91,7 +93,7 @@ APP_STYLESHEET = """
         background-color: #f39c12;
         color: white;
     }
-    QTableWidget {
+    QTableView {
         gridline-color: #bdc3c7;
         background-color: white;
         alternate-background-color: #f8f9fa;
@@ -99,12 +101,12 @@ APP_STYLESHEET = """
         border-radius: 4px;
         color: #2c3e50;
     }
-    QTableWidget::item {
+    QTableView::item {
         padding: 8px;
         border-bottom: 1px solid #ecf0f1;
         color: #2c3e50;
     }
-    QTableWidget::item:selected {
+    QTableView::item:selected {
         background-color: #e67e22;
         color: white;
     }
@@ -164,6 +166,17 @@ APP_STYLESHEET = """
     }
 """
 
+
+def _minify_stylesheet(stylesheet: str) -> str:
+    """Drop comments and redundant whitespace so Qt's style parser walks a smaller buffer."""
+    stylesheet = re.sub(r'/\*.*?\*/', '', stylesheet, flags=re.DOTALL)
+    stylesheet = re.sub(r'\s+', ' ', stylesheet)
+    return re.sub(r'\s*([{};])\s*', r'\1', stylesheet).strip()
+
+
+# Minified once at import; the readable form above is what gets edited
+APP_STYLESHEET = _minify_stylesheet(APP_STYLESHEET)
+
 # Color palettes for charts
 WARM_COLORS = ['#e67e22', '#d35400', '#f39c12', '#e74c3c', '#c0392b']
 WARM_RADAR_COLORS = ['#e67e22', '#d35400', '#f39c12', '#e74c3c', '#c0392b']
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+Table helpers
+A read-only text table model for QTableViews whose cells are plain strings.
+"""
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+
+class TextTableModel(QAbstractTableModel):
+    """
+    Read-only table of preformatted strings. The view only asks for visible cells,
+    and replacing the rows is a single model reset instead of one item per cell.
+    
+    :param headers: Column header labels
+    :param rows: Initial rows, each a sequence of one string per column
+    :param centered_from: First column whose cells are center aligned
+    """
+    
+    def __init__(self, headers, rows=(), centered_from: int = 0, parent=None):
+        super().__init__(parent)
+        self._headers = tuple(headers)
+        self._rows = list(rows)
+        self._centered_from = centered_from
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.ItemDataRole.TextAlignmentRole and index.column() >= self._centered_from:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+    
+    def set_rows(self, rows):
+        """
+        Replace every row in one model reset.
+        
+        :param rows: Sequence of rows, each a sequence of one string per column
+        """
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+    
+    def clear_contents(self):
+        """Blank every cell but keep the rows, like QTableWidget.clearContents()."""
+        self.set_rows([("",) * len(self._headers)] * len(self._rows))
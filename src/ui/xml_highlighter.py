@@ -11,9 +11,22 @@ from PyQt6.QtGui import QFont, QSyntaxHighlighter, QTextCharFormat, QColor
 class XmlSyntaxHighlighter(QSyntaxHighlighter):
     """XML Syntax Highlighter for CGRA operator configuration files."""
     
+    # (highlighting rules, combined pattern, group formats) shared by all instances
+    _shared = None
+    
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.highlighting_rules = []
+        self.highlighting_rules, self.combined_pattern, self.group_formats = self._shared_rules()
+    
+    @classmethod
+    def _shared_rules(cls):
+        """
+        Build the formats and the combined pattern once and return them. Formats are
+        never modified and matching keeps its state in the iterator, so all
+        highlighters share the same objects.
+        """
+        if cls._shared is not None:
+            return cls._shared
         
         # XML tag format - warm orange-brown color
         xml_tag_format = QTextCharFormat()
@@ -39,53 +52,42 @@ class XmlSyntaxHighlighter(QSyntaxHighlighter):
         xml_keyword_format.setForeground(QColor(166, 89, 78))  # Warm red-brown
         xml_keyword_format.setFontWeight(QFont.Weight.Bold)
         
-        # Define highlighting rules
-        # XML tags: <tag> and </tag>
-        self.highlighting_rules.append((
-            QRegularExpression(r'</?[!]?[A-Za-z]+[^>]*>'),
-            xml_tag_format
-        ))
-        
-        # XML attribute names: attribute=
-        self.highlighting_rules.append((
-            QRegularExpression(r'\b[A-Za-z_][A-Za-z0-9_]*(?=\s*=)'),
-            xml_attr_name_format
-        ))
-        
-        # XML attribute values: "value" or 'value'
-        self.highlighting_rules.append((
-            QRegularExpression(r'"[^"]*"'),
-            xml_attr_value_format
-        ))
-        self.highlighting_rules.append((
-            QRegularExpression(r"'[^']*'"),
-            xml_attr_value_format
-        ))
-        
-        # XML comments: <!-- comment -->
-        self.highlighting_rules.append((
-            QRegularExpression(r'<!--.*-->'),
-            xml_comment_format
-        ))
-        
-        # XML processing instructions: <?xml ... ?>
-        self.highlighting_rules.append((
-            QRegularExpression(r'<\?.*\?>'),
-            xml_keyword_format
-        ))
-        
-        # XML CDATA sections: <![CDATA[ ... ]]>
-        self.highlighting_rules.append((
-            QRegularExpression(r'<!\[CDATA\[.*\]\]>'),
-            xml_keyword_format
-        ))
+        # Define highlighting rules as one alternation, scanned in a single pass per block.
+        # Each top-level group is a token kind; lastCapturedIndex() selects its format.
+        # Comments, CDATA and processing instructions come first so they win over the
+        # tag/attribute/value tokens they contain. Their bodies are non-greedy so two
+        # comments on one line stay two tokens instead of one spanning the text between.
+        highlighting_rules = (
+            # XML comments: <!-- comment -->
+            (r'<!--.*?-->', xml_comment_format),
+            # XML CDATA sections: <![CDATA[ ... ]]>
+            (r'<!\[CDATA\[.*?\]\]>', xml_keyword_format),
+            # XML processing instructions: <?xml ... ?>
+            (r'<\?.*?\?>', xml_keyword_format),
+            # XML tags: "<tag", "</tag", "<!DOCTYPE", closing "/>" or ">" and "="
+            (r'</?[!]?[A-Za-z]+|/?>|=', xml_tag_format),
+            # XML attribute names: attribute=
+            (r'\b[A-Za-z_][A-Za-z0-9_]*(?=\s*=)', xml_attr_name_format),
+            # XML attribute values: "value" or 'value'
+            (r'"[^"]*"|' r"'[^']*'", xml_attr_value_format),
+        )
+        combined_pattern = QRegularExpression(
+            '|'.join(f'({pattern})' for pattern, _ in highlighting_rules)
+        )
+        # Capture group i (1-based) maps to the format of rule i-1
+        group_formats = (None,) + tuple(format_obj for _, format_obj in highlighting_rules)
+        cls._shared = (highlighting_rules, combined_pattern, group_formats)
+        return cls._shared
     
     def highlightBlock(self, text):
         """Apply syntax highlighting to the given text block."""
-        # Apply each highlighting rule
-        for pattern, format_obj in self.highlighting_rules:
-            expression = pattern
-            match_iterator = expression.globalMatch(text)
-            while match_iterator.hasNext():
-                match = match_iterator.next()
-                self.setFormat(match.capturedStart(), match.capturedLength(), format_obj)
\ No newline at end of file
+        # Every token contains one of < > = " ', so plain text lines skip the regex
+        if '<' not in text and '=' not in text and '>' not in text and '"' not in text and "'" not in text:
+            return
+        set_format = self.setFormat
+        group_formats = self.group_formats
+        match_iterator = self.combined_pattern.globalMatch(text)
+        while match_iterator.hasNext():
+            match = match_iterator.next()
+            set_format(match.capturedStart(), match.capturedLength(),
+                       group_formats[match.lastCapturedIndex()])
@@ -4,52 +4,78 @@ Utility Functions Module
 Contains helper functions for data formatting and text processing.
 """
 
-import re
+import sys
+from functools import lru_cache
+
+# Maps every ASCII character outside [a-z0-9] to '_' (non-ASCII is first encoded to '?')
+_SLUG_TABLE = str.maketrans({
+    c: c if c.isdigit() or 'a' <= c <= 'z' else '_' for c in map(chr, range(128))
+})
+
+# Thresholds of format_bytes
+_KB = 1 << 10
+_MB = 1 << 20
 
 
 def slugify(op_name: str) -> str:
     """Convert operator name to a slug format for file naming."""
-    s = op_name.lower()
-    s = re.sub(r'[^a-z0-9]+', '_', s)
-    s = s.strip('_')
-    return s
+    s = op_name.lower().encode('ascii', 'replace').decode('ascii').translate(_SLUG_TABLE)
+    # Dropping the empty pieces collapses runs of '_' and strips them from both ends
+    return '_'.join(filter(None, s.split('_')))
 
 
 def format_bytes(bytes_val):
     """Format bytes values to human readable format (KB, MB, etc.)"""
-    if not isinstance(bytes_val, (int, float)) or bytes_val == 0:
+    # Exact type checks are cheaper than isinstance() with a tuple; config values are plain int/float
+    t = type(bytes_val)
+    if (t is not int and t is not float) or not bytes_val:
         return "-"
     
-    if bytes_val >= 1024*1024:
-        return f"{bytes_val/(1024*1024):.1f} MB"
-    elif bytes_val >= 1024:
-        return f"{bytes_val/1024:.0f} KB"
+    if bytes_val >= _MB:
+        return f"{bytes_val/_MB:.1f} MB"
+    elif bytes_val >= _KB:
+        # round() is half-to-even like :.0f, but formatting the int skips float formatting
+        return f"{round(bytes_val / _KB)} KB"
     else:
         return f"{bytes_val} B"
 
 
 def format_number_with_commas(value):
     """Format number with comma separators."""
-    if isinstance(value, (int, float)) and value != 0:
+    t = type(value)
+    if (t is int or t is float) and value:
         return f"{value:,}"
     return "-"
 
 
 def format_float_precision(value, precision=2):
     """Format float with specified precision."""
-    if isinstance(value, (int, float)) and value != 0:
+    t = type(value)
+    if (t is int or t is float) and value:
         return f"{value:.{precision}f}"
     return "-"
 
 
 def safe_float_conversion(value, default=0.0):
-    """Safely convert value to float with fallback."""
+    """Safely convert value to float with fallback (only None and "" count as missing)."""
+    t = type(value)
+    if t is float:
+        return value
+    if t is int:
+        return float(value)
+    if value is None or (t is str and not value):
+        return default
     try:
-        return float(value) if value else default
+        return float(value)
     except (ValueError, TypeError):
         return default
 
 
+@lru_cache(maxsize=256)
 def cache_key(operator: str, arch: str) -> str:
-    """Generate a unique cache key combining operator and architecture."""
-    return f"{operator}::{arch}"
\ No newline at end of file
+    """
+    Generate a unique cache key combining operator and architecture.
+    Memoized and interned so every lookup for the same pair returns the same string
+    object, even after it was evicted, and dict lookups can match on identity.
+    """
+    return sys.intern(f"{operator}::{arch}")
\ No newline at end of file
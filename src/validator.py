@@ -6,12 +6,27 @@ Provides functions to run CGRA simulation and validation without spawning a sepa
 
 import os
 import sys
+import locale
 import subprocess
 import stat
 import importlib.util
+import shutil
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
 from typing import Callable, Optional
+import numpy as np
 from resource_path import get_project_root, get_bin_path, get_data_path
-from golden_models import init_golden_manager, get_golden_manager
+from golden_models import init_golden_manager, get_golden_manager, GOLDEN_ENTRY_POINTS
+
+# numba compiles the compare_results scan into one native loop when installed
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 
 # Get the project root directory (works in both dev and packaged environments)
@@ -23,26 +38,171 @@ RESOURCE_DIR = get_data_path()
 # Initialize golden model manager
 _golden_manager = init_golden_manager(RESOURCE_DIR)
 
+# compare_results reports this many mismatched lines individually; the rest only count in the summary
+COMPARE_MAX_REPORTED = 20
+# compare_results reads both files this many lines at a time, so memory stays bounded
+COMPARE_CHUNK_LINES = 64 * 1024
+# Child process output is read in blocks of up to this many bytes, not line by line
+OUTPUT_READ_SIZE = 64 * 1024
+# Output lines of a failed golden model subprocess quoted in the error
+GOLDEN_ERROR_TAIL_LINES = 20
+
+# sys.argv is process-wide; golden models that still read it run one at a time
+_GOLDEN_ARGV_LOCK = threading.Lock()
+# full model path -> (mtime_ns, code, module, entry point) of the direct import fallback
+_GOLDEN_MODULE_CACHE = {}
+_GOLDEN_MODULE_LOCK = threading.Lock()
+
+# Simulator path resolved by get_executable_path, None until then
+_executable_path = None
+
+# Child processes started by run_simulator and the golden model subprocess, while they run,
+# mapped to the cancel event of the validation that started them (or None)
+_ACTIVE_PROCESSES = {}
+_ACTIVE_PROCESSES_LOCK = threading.Lock()
+# terminate_child_processes kills children still running this long after SIGTERM
+CHILD_KILL_GRACE_SECONDS = 2.0
+
 
 def get_executable_path():
-    """Get the platform-specific executable path for CGRA simulator."""
+    """
+    Get the platform-specific executable path for CGRA simulator.
+    Resolved once; later calls return the cached path without touching the filesystem.
+    """
+    global _executable_path
+    if _executable_path is None:
+        return refresh_executable_path()
+    return _executable_path
+
+
+def refresh_executable_path():
+    """
+    Resolve the simulator path again (e.g. after the binary was replaced) and cache it.
+    A missing executable is not cached, so the next call looks for it again.
+    """
+    global _executable_path
     base_path = EXEC_PATH
     if sys.platform.startswith('win'):
-        exe_path = base_path + ".exe"
-    else:
-        exe_path = base_path
-        # Try to add execute permission on Linux/Unix
-        if os.path.exists(exe_path):
-            st = os.stat(exe_path)
-            os.chmod(exe_path, st.st_mode | stat.S_IEXEC)
-        else:
-            print(f"Warning: Executable {exe_path} not found!")
+        _executable_path = base_path + ".exe"
+        return _executable_path
+    exe_path = base_path
+    # Try to add execute permission on Linux/Unix; chmod only when the bit is missing
+    try:
+        st = os.stat(exe_path)
+    except FileNotFoundError:
+        print(f"Warning: Executable {exe_path} not found!")
+        _executable_path = None
+        return exe_path
+    if not st.st_mode & stat.S_IEXEC:
+        os.chmod(exe_path, st.st_mode | stat.S_IEXEC)
+    _executable_path = exe_path
     return exe_path
 
 
+def _check_cancelled(cancel_event: Optional[threading.Event]):
+    """Raise RuntimeError if cancel_event is set."""
+    if cancel_event is not None and cancel_event.is_set():
+        raise RuntimeError("Validation cancelled")
+
+
+@contextmanager
+def _child_process(command, cwd: str = None, cancel_event: Optional[threading.Event] = None):
+    """
+    Start command with stdout and stderr on one pipe, registered in _ACTIVE_PROCESSES
+    while the block runs so terminate_child_processes can reach it.
+    Raises RuntimeError instead of starting it once cancel_event is set.
+    """
+    # Checked and registered under the lock terminate_child_processes takes after setting
+    # the event, so a child is either refused or reached by it, never missed
+    with _ACTIVE_PROCESSES_LOCK:
+        _check_cancelled(cancel_event)
+        # Unbuffered binary pipe: output is read straight from the fd and decoded in bulk, not line by line
+        process = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=0,
+            cwd=cwd
+        )
+        _ACTIVE_PROCESSES[process] = cancel_event
+    try:
+        yield process
+    finally:
+        with _ACTIVE_PROCESSES_LOCK:
+            _ACTIVE_PROCESSES.pop(process, None)
+
+
+def terminate_child_processes(cancel_event: Optional[threading.Event] = None,
+                              grace: float = CHILD_KILL_GRACE_SECONDS):
+    """
+    Ask running simulator and golden model subprocesses to exit (SIGTERM), and kill
+    those still running after grace seconds. Returns immediately; their readers see
+    the pipe close and the failing exit code.
+    
+    :param cancel_event: Only stop the children of the validation with this cancel event
+        (set it first, so that validation starts no new ones); None stops all of them.
+    :param grace: Seconds between terminate() and kill().
+    """
+    with _ACTIVE_PROCESSES_LOCK:
+        processes = [process for process, event in _ACTIVE_PROCESSES.items()
+                     if (cancel_event is None or event is cancel_event) and process.poll() is None]
+    for process in processes:
+        try:
+            process.terminate()
+        except OSError:
+            pass
+    if processes:
+        threading.Thread(target=_kill_after, args=(processes, grace),
+                         name="child-reaper", daemon=True).start()
+
+
+def _kill_after(processes, grace: float):
+    """Kill the processes that have not exited grace seconds from now."""
+    deadline = time.monotonic() + grace
+    for process in processes:
+        try:
+            process.wait(max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            try:
+                process.kill()
+            except OSError:
+                pass
+
+
+def _iter_output_batches(stream):
+    """
+    Yield the lines of a binary child process pipe, without their line endings, in batches.
+    Whatever output is available is read as one block, decoded in one call and yielded
+    as one list, so batching never holds a line back; line endings are translated
+    the same way text mode does.
+    
+    :param stream: Binary stdout pipe of a subprocess.Popen (bufsize=0; it is read through its fd).
+    """
+    encoding = locale.getpreferredencoding(False)
+    fd = stream.fileno()
+    pending = b""
+    while True:
+        # os.read returns whatever the pipe holds (up to the limit) without a buffer layer in between
+        chunk = os.read(fd, OUTPUT_READ_SIZE)
+        if not chunk:
+            if not pending:
+                break
+            # A last line without a newline is still a line
+            chunk = b"\n"
+        data = pending + chunk
+        # Decode up to the last newline; an incomplete line waits for the next block
+        end = data.rfind(b"\n") + 1
+        pending = data[end:]
+        if end:
+            text = data[:end].decode(encoding, errors="replace")
+            yield text.replace("\r\n", "\n").replace("\r", "\n").split("\n")[:-1]
+
+
 def run_simulator(exec_path: str, task: str, mem_file: str, 
                   resource_dir: str = None,
-                  stdout_callback: Optional[Callable[[str], None]] = None):
+                  stdout_callback: Optional[Callable[[str], None]] = None,
+                  cwd: str = None,
+                  cancel_event: Optional[threading.Event] = None):
     """
     Run the CGRA simulator with real-time output.
     
@@ -51,6 +211,8 @@ def run_simulator(exec_path: str, task: str, mem_file: str,
     :param mem_file: Memory file to be used in the simulation.
     :param resource_dir: Resource directory path (defaults to PROJECT_ROOT/data).
     :param stdout_callback: Optional callback function to receive output lines in real-time.
+    :param cwd: Working directory of the simulator (relative task/mem_file are resolved from it).
+    :param cancel_event: Once set, the simulator is not started (see terminate_child_processes).
     :return: Exit code of the simulation.
     """
     if resource_dir is None:
@@ -64,24 +226,16 @@ def run_simulator(exec_path: str, task: str, mem_file: str,
     else:
         print(msg)
 
-    process = subprocess.Popen(
-        command,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1,
-        universal_newlines=True
-    )
-
-    # Real-time output
-    for line in process.stdout:
-        if stdout_callback:
-            stdout_callback(line.rstrip('\n'))
-        else:
-            print(line, end='')
+    with _child_process(command, cwd, cancel_event) as process:
+        # Real-time output; each batch is one callback (one signal for a GUI) instead of one per line
+        for lines in _iter_output_batches(process.stdout):
+            if stdout_callback:
+                stdout_callback("\n".join(lines))
+            else:
+                print(*lines, sep="\n")
 
-    process.stdout.close()
-    return_code = process.wait()
+        process.stdout.close()
+        return_code = process.wait()
 
     if return_code != 0:
         error_msg = f"Simulation failed with exit code {return_code}."
@@ -99,7 +253,9 @@ def run_simulator(exec_path: str, task: str, mem_file: str,
 
 
 def run_golden_model(model_path: str, mem_file: str, golden_file: str,
-                     stdout_callback: Optional[Callable[[str], None]] = None):
+                     stdout_callback: Optional[Callable[[str], None]] = None,
+                     cwd: str = None,
+                     cancel_event: Optional[threading.Event] = None):
     """
     Run the golden model with the given parameters.
     Uses the golden model manager for packaged environments.
@@ -108,14 +264,10 @@ def run_golden_model(model_path: str, mem_file: str, golden_file: str,
     :param mem_file: Memory file to be used in the golden model.
     :param golden_file: Output file for golden results.
     :param stdout_callback: Optional callback function to receive output in real-time.
+    :param cwd: Working directory of the subprocess fallback (defaults to the current directory).
+    :param cancel_event: Once set, the subprocess fallback is not started.
     :return: The result of the golden model execution.
     """
-    def output(msg: str):
-        if stdout_callback:
-            stdout_callback(msg)
-        else:
-            print(msg)
-    
     try:
         # Extract task name from model path
         # model_path is typically like "gemm_fp32_slice16/golden.py"
@@ -135,17 +287,23 @@ def run_golden_model(model_path: str, mem_file: str, golden_file: str,
             
     except Exception as e:
         # Final fallback to subprocess if available
-        return _run_golden_model_subprocess(model_path, mem_file, golden_file, stdout_callback, e)
+        return _run_golden_model_subprocess(model_path, mem_file, golden_file, stdout_callback, e,
+                                            cwd=cwd, cancel_event=cancel_event)
 
 
 def _run_golden_model_direct(model_path: str, mem_file: str, golden_file: str,
                            stdout_callback: Optional[Callable[[str], None]] = None):
-    """Direct import method for running golden models."""
-    def output(msg: str):
-        if stdout_callback:
-            stdout_callback(msg)
-        else:
-            print(msg)
+    """
+    Direct import method for running golden models.
+    
+    The cwd and sys.path are left untouched: relative file paths are resolved against
+    the model's directory, and the module gets MODEL_DIR, INPUT_FILE and OUTPUT_FILE
+    attributes before it is executed. The module is loaded once per script mtime and
+    reused by later runs. Models should expose one of GOLDEN_ENTRY_POINTS
+    (called with the two files); models that only read sys.argv in their __main__
+    block are run with a patched sys.argv, serialized by _GOLDEN_ARGV_LOCK.
+    """
+    output = stdout_callback or print
     
     # Construct full path if needed
     if not os.path.isabs(model_path):
@@ -153,58 +311,105 @@ def _run_golden_model_direct(model_path: str, mem_file: str, golden_file: str,
     else:
         full_model_path = model_path
         
-    if not os.path.exists(full_model_path):
-        raise FileNotFoundError(f"Golden model file not found: {full_model_path}")
+    try:
+        mtime_ns = os.stat(full_model_path).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Golden model file not found: {full_model_path}") from None
     
-    # Load the golden model as a module
-    spec = importlib.util.spec_from_file_location("golden_model", full_model_path)
-    golden_module = importlib.util.module_from_spec(spec)
+    model_dir = os.path.dirname(full_model_path)
+    model_globals = {
+        "MODEL_DIR": model_dir,
+        "INPUT_FILE": os.path.join(model_dir, mem_file),
+        "OUTPUT_FILE": os.path.join(model_dir, golden_file),
+    }
     
-    # Save original state
-    original_path = sys.path.copy()
-    original_argv = sys.argv.copy()
-    original_cwd = os.getcwd()
+    code, golden_module, entry_point = _load_golden_module(full_model_path, mtime_ns, model_globals)
+    if entry_point is not None:
+        golden_module.__dict__.update(model_globals)
+        entry_point(model_globals["INPUT_FILE"], model_globals["OUTPUT_FILE"])
+    else:
+        # Fresh globals each run, like running the script from the command line
+        main_globals = {"__name__": "__main__", "__file__": full_model_path, **model_globals}
+        with _patched_argv(["golden.py", model_globals["INPUT_FILE"], model_globals["OUTPUT_FILE"]]):
+            exec(code, main_globals)
     
-    try:
-        # Set up environment
-        model_dir = os.path.dirname(full_model_path)
-        os.chdir(model_dir)
-        
-        if model_dir not in sys.path:
-            sys.path.insert(0, model_dir)
-        
-        sys.argv = ["golden.py", mem_file, golden_file]
+    output(f"Golden model executed successfully via direct import")
+    return "Success"
+
+
+def _load_golden_module(full_model_path: str, mtime_ns: int, model_globals: dict):
+    """
+    Return (code, module, entry point) of the golden model at full_model_path, compiling
+    the script only when it is new or its mtime changed since the last load.
+    Only a script whose top level binds one of GOLDEN_ENTRY_POINTS is executed here, as a
+    module; for the others module and entry point are None and the caller runs the code
+    as __main__, so their top-level code still runs once per call, not twice.
+    """
+    with _GOLDEN_MODULE_LOCK:
+        cached = _GOLDEN_MODULE_CACHE.get(full_model_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1:]
         
-        # Execute the module
-        spec.loader.exec_module(golden_module)
+        with open(full_model_path, 'rb') as f:
+            code = compile(f.read(), full_model_path, 'exec')
         
-        output(f"Golden model executed successfully via direct import")
-        return "Success"
+        golden_module = entry_point = None
+        # co_names holds the names the module body binds, so argv-only scripts are not probed
+        if any(name in code.co_names for name in GOLDEN_ENTRY_POINTS):
+            # Load the golden model as a module
+            spec = importlib.util.spec_from_file_location("golden_model", full_model_path)
+            golden_module = importlib.util.module_from_spec(spec)
+            golden_module.__dict__.update(model_globals)
+            exec(code, golden_module.__dict__)
+            for name in GOLDEN_ENTRY_POINTS:
+                candidate = getattr(golden_module, name, None)
+                if callable(candidate):
+                    entry_point = candidate
+                    break
+            else:
+                # The name was not a function after all; later calls skip the probe
+                golden_module = None
         
-    finally:
-        # Restore original state
-        sys.path = original_path
-        sys.argv = original_argv
-        os.chdir(original_cwd)
+        # Replacing the entry evicts the one of an older mtime
+        cached = _GOLDEN_MODULE_CACHE[full_model_path] = (mtime_ns, code, golden_module, entry_point)
+        return cached[1:]
+
+
+@contextmanager
+def _patched_argv(argv):
+    """Temporarily replace sys.argv, holding _GOLDEN_ARGV_LOCK so concurrent runs cannot interleave."""
+    with _GOLDEN_ARGV_LOCK:
+        original_argv = sys.argv
+        sys.argv = argv
+        try:
+            yield
+        finally:
+            sys.argv = original_argv
+
+
+@lru_cache(maxsize=None)
+def _python_executable():
+    """
+    Return the interpreter for golden model subprocesses, or None if there is none.
+    Looked up once instead of probing with "python --version" on every fallback;
+    a packaged build's sys.executable is the app itself, so it falls back to PATH.
+    """
+    if sys.executable and not getattr(sys, "frozen", False):
+        return sys.executable
+    return shutil.which("python")
 
 
 def _run_golden_model_subprocess(model_path: str, mem_file: str, golden_file: str,
                                stdout_callback: Optional[Callable[[str], None]] = None,
-                               original_error: Exception = None):
+                               original_error: Exception = None,
+                               cwd: str = None,
+                               cancel_event: Optional[threading.Event] = None):
     """Subprocess fallback method for development environments."""
-    def output(msg: str):
-        if stdout_callback:
-            stdout_callback(msg)
-        else:
-            print(msg)
+    output = stdout_callback or print
     
     # Check if Python interpreter is available
-    try:
-        result = subprocess.run(["python", "--version"], 
-                              capture_output=True, text=True, timeout=5)
-        if result.returncode != 0:
-            raise RuntimeError("Python interpreter not available")
-    except (subprocess.TimeoutExpired, FileNotFoundError, RuntimeError):
+    python_exe = _python_executable()
+    if python_exe is None:
         error_msg = (
             "Cannot run golden model: Python interpreter not available and direct import failed. "
             "This typically happens in packaged environments where Python is not installed. "
@@ -221,20 +426,154 @@ def _run_golden_model_subprocess(model_path: str, mem_file: str, golden_file: st
     
     output(f"Direct import failed, trying subprocess method...")
     
-    # Run with subprocess
-    command = ["python", full_model_path, mem_file, golden_file]
-    result = subprocess.run(command, capture_output=True, text=True)
+    # Run with subprocess; output is streamed as it is produced instead of captured,
+    # keeping only the last lines for the error message
+    command = [python_exe, full_model_path, mem_file, golden_file]
+    tail = deque(maxlen=GOLDEN_ERROR_TAIL_LINES)
+    with _child_process(command, cwd, cancel_event) as process:
+        for lines in _iter_output_batches(process.stdout):
+            output("\n".join(lines))
+            tail.extend(lines)
+        process.stdout.close()
+        return_code = process.wait()
     
-    if result.returncode != 0:
-        error_msg = f"Golden model execution failed: {result.stderr}"
+    if return_code != 0:
+        error_msg = "Golden model execution failed: " + "\n".join(tail)
         raise RuntimeError(error_msg)
     
-    output(f"Golden model executed successfully via subprocess: {result.stdout}")
-    return result.stdout
+    output("Golden model executed successfully via subprocess")
+    return "Success"
+
+
+def _parse_words(lines):
+    """
+    Parse memory image lines (one number per line) into float64 words.
+    
+    :param lines: Lines read from a memory image file.
+    :return: (values, invalid) where invalid marks lines that are not a number (their value is NaN).
+    """
+    try:
+        # One C-level conversion for the common, well-formed case
+        values = np.array(lines, dtype=np.float64)
+        return values, np.zeros(values.shape, dtype=bool)
+    except ValueError:
+        pass
+    values = np.empty(len(lines), dtype=np.float64)
+    invalid = np.zeros(len(lines), dtype=bool)
+    for i, line in enumerate(lines):
+        try:
+            values[i] = float(line)
+        except ValueError:
+            values[i] = np.nan
+            invalid[i] = True
+    return values, invalid
+
+
+def _relative_errors(g_vals, m_vals):
+    """
+    Relative error |g - m| / max(|g|, 1e-8) of every word, computed with in-place ufuncs
+    (two buffers instead of a temporary per operation).
+    
+    :param g_vals: Golden words.
+    :param m_vals: Simulator words.
+    :return: Array of relative errors (NaN where either word is NaN).
+    """
+    with np.errstate(all='ignore'):
+        rel_errors = np.subtract(g_vals, m_vals)
+        np.abs(rel_errors, out=rel_errors)
+        denom = np.abs(g_vals)
+        np.maximum(denom, 1e-8, out=denom)
+        np.divide(rel_errors, denom, out=rel_errors)
+    return rel_errors
+
+
+def _compare_chunk(g_vals, m_vals, invalid, tolerance: float, max_indices: int):
+    """
+    Compare one chunk of words.
+    
+    :param g_vals: Golden words.
+    :param m_vals: Simulator words.
+    :param invalid: Mask of unparsable lines (always mismatches, left out of the error statistics).
+    :param tolerance: Relative error tolerance threshold.
+    :param max_indices: How many mismatch indices to return at most.
+    :return: (mismatch count, max relative error, sum of relative errors, first mismatch indices)
+    """
+    rel_errors = _relative_errors(g_vals, m_vals)
+    valid_errors = rel_errors[~invalid] if invalid.any() else rel_errors
+    flagged = np.flatnonzero((rel_errors > tolerance) | invalid)
+    return (int(flagged.size), float(np.fmax.reduce(valid_errors, initial=0.0)),
+            float(valid_errors.sum()), flagged[:max_indices])
+
+
+def _compare_chunk_loop(g_vals, m_vals, invalid, tolerance, max_indices):
+    """
+    Single-pass version of _compare_chunk without temporary arrays, compiled by numba
+    (as _compare_chunk_native) when it is installed; too slow to run uncompiled.
+    NaN handling matches the NumPy version: NaN errors count in the sum, not the max.
+    """
+    indices = np.empty(max_indices, dtype=np.int64)
+    count = 0
+    max_error = 0.0
+    sum_error = 0.0
+    for i in range(g_vals.size):
+        if invalid[i]:
+            flagged = True
+        else:
+            denom = abs(g_vals[i])
+            if denom < 1e-8:
+                denom = 1e-8
+            rel_error = abs(g_vals[i] - m_vals[i]) / denom
+            sum_error += rel_error
+            if rel_error > max_error:
+                max_error = rel_error
+            flagged = rel_error > tolerance
+        if flagged:
+            if count < max_indices:
+                indices[count] = i
+            count += 1
+    return count, max_error, sum_error, indices[:min(count, max_indices)]
+
+
+_compare_chunk_native = (njit(cache=True, error_model='numpy')(_compare_chunk_loop)
+                         if njit is not None else None)
+
+
+def prewarm():
+    """
+    Compile _compare_chunk_native (or load it from numba's on-disk cache) in a background
+    thread, so the first compare_results does not wait for the JIT. Golden models are
+    warmed separately by GoldenModelManager.prefetch.
+    
+    :return: The started thread, or None without numba.
+    """
+    if _compare_chunk_native is None:
+        return None
+    thread = threading.Thread(target=_prewarm, name="compare-prewarm", daemon=True)
+    thread.start()
+    return thread
+
+
+def _prewarm():
+    """Body of the prewarm thread: one call with the argument types compare_results uses."""
+    try:
+        _compare_chunk_native(np.zeros(1), np.zeros(1), np.zeros(1, dtype=bool), 1e-3, 1)
+    except Exception:
+        # compare_results reports the error if compilation fails for real
+        pass
+
+
+def _mismatch_message(line_no: int, invalid: bool, golden_line: str, mem_line: str,
+                      g_val: float, m_val: float, rel_error: float) -> str:
+    """Report line of compare_results for one unparsable or mismatched line."""
+    if invalid:
+        return f"Line {line_no}: Invalid float format -> '{golden_line.strip()}' or '{mem_line.strip()}'"
+    return (f"Line {line_no}: Relative mismatch! "
+            f"Golden={g_val:.7f}, Sim={m_val:.7f}, RelErr={rel_error:.7f}")
 
 
 def compare_results(golden_file: str, mem_file: str, tolerance: float = 1e-4,
-                   stdout_callback: Optional[Callable[[str], None]] = None):
+                   stdout_callback: Optional[Callable[[str], None]] = None,
+                   fail_fast: bool = False):
     """
     Compare the results of the golden model and the simulator using relative error.
     Each line in both files represents a memory address with a float32 number.
@@ -243,50 +582,63 @@ def compare_results(golden_file: str, mem_file: str, tolerance: float = 1e-4,
     :param mem_file: Path to simulator output file.
     :param tolerance: Relative error tolerance threshold.
     :param stdout_callback: Optional callback function to receive output in real-time.
+    :param fail_fast: Stop at the first mismatched line and skip the summary (pass/fail only).
     :return: True if all values match within tolerance, False otherwise.
     """
-    def output(msg: str):
-        if stdout_callback:
-            stdout_callback(msg)
-        else:
-            print(msg)
+    output = stdout_callback or print
     
-    with open(golden_file, 'r') as f1, open(mem_file, 'r') as f2:
-        golden_lines = f1.readlines()
-        mem_lines = f2.readlines()
-
-    if len(golden_lines) != len(mem_lines):
-        output(f"Line count mismatch: {len(golden_lines)} vs {len(mem_lines)}")
-        return False
-
-    total = len(golden_lines)
+    total = 0
     mismatches = 0
     max_rel_error = 0.0
     sum_rel_error = 0.0
-    all_match = True
+    # Held back until both files are known to have the same length
+    reports = []
+
+    with open(golden_file, 'r') as f1, open(mem_file, 'r') as f2:
+        while True:
+            golden_lines = list(islice(f1, COMPARE_CHUNK_LINES))
+            mem_lines = list(islice(f2, COMPARE_CHUNK_LINES))
+            if len(golden_lines) != len(mem_lines):
+                # One file ended early; count what is left of both for the message
+                golden_count = total + len(golden_lines) + sum(1 for _ in f1)
+                mem_count = total + len(mem_lines) + sum(1 for _ in f2)
+                output(f"Line count mismatch: {golden_count} vs {mem_count}")
+                return False
+            if not golden_lines:
+                break
+
+            g_vals, g_invalid = _parse_words(golden_lines)
+            m_vals, m_invalid = _parse_words(mem_lines)
+            invalid = g_invalid | m_invalid
+
+            # Only as many mismatch indices as will be reported are collected
+            limit = 1 if fail_fast else COMPARE_MAX_REPORTED - len(reports)
+            compare_chunk = _compare_chunk_native or _compare_chunk
+            count, chunk_max, chunk_sum, indices = compare_chunk(g_vals, m_vals, invalid, tolerance, limit)
+            max_rel_error = max(max_rel_error, float(chunk_max))
+            sum_rel_error += float(chunk_sum)
+
+            rel_errors = _relative_errors(g_vals[indices], m_vals[indices])
+            messages = [
+                _mismatch_message(total + i, invalid[i], golden_lines[i], mem_lines[i],
+                                  g_vals[i], m_vals[i], rel_error)
+                for i, rel_error in zip(indices.tolist(), rel_errors.tolist())
+            ]
+            if fail_fast and count:
+                # Pass/fail only: report the first mismatch and leave the rest of both files unread
+                output(messages[0])
+                output(f"\nStopped at the first value beyond relative error tolerance {tolerance}.")
+                return False
+            reports.extend(messages)
+            mismatches += count
+            total += len(golden_lines)
+
+    all_match = mismatches == 0
+    for report in reports:
+        output(report)
+    if mismatches > COMPARE_MAX_REPORTED:
+        output(f"... {mismatches - COMPARE_MAX_REPORTED} more mismatched lines not shown")
 
-    for i, (g_line, m_line) in enumerate(zip(golden_lines, mem_lines)):
-        try:
-            g_val = float(g_line.strip())
-            m_val = float(m_line.strip())
-        except ValueError:
-            output(f"Line {i}: Invalid float format -> '{g_line.strip()}' or '{m_line.strip()}'")
-            mismatches += 1
-            all_match = False
-            continue
-
-        denom = max(abs(g_val), 1e-8)
-        rel_error = abs(g_val - m_val) / denom
-        sum_rel_error += rel_error
-        max_rel_error = max(max_rel_error, rel_error)
-
-        if rel_error > tolerance:
-            output(f"Line {i}: Relative mismatch! "
-                  f"Golden={g_val:.7f}, Sim={m_val:.7f}, RelErr={rel_error:.7f}")
-            mismatches += 1
-            all_match = False
-
-    matched = total - mismatches
     mean_rel_error = sum_rel_error / total if total > 0 else 0.0
 
     output("\nComparison Summary:")
@@ -307,7 +659,8 @@ def run_validation(task: str,
                   output_dir: str = None,
                   resource_dir: str = None,
                   stdout_callback: Optional[Callable[[str], None]] = None,
-                  stderr_callback: Optional[Callable[[str], None]] = None):
+                  stderr_callback: Optional[Callable[[str], None]] = None,
+                  cancel_event: Optional[threading.Event] = None):
     """
     Run the complete validation workflow: golden model, simulator, and comparison.
     
@@ -317,13 +670,11 @@ def run_validation(task: str,
     :param resource_dir: Resource directory path (defaults to PROJECT_ROOT/data)
     :param stdout_callback: Optional callback for stdout messages
     :param stderr_callback: Optional callback for stderr messages
+    :param cancel_event: Once set, no further step and no child process is started
+        (running children are stopped by terminate_child_processes)
     :return: True if validation passes, False otherwise
     """
-    def output(msg: str):
-        if stdout_callback:
-            stdout_callback(msg)
-        else:
-            print(msg)
+    output = stdout_callback or print
     
     try:
         # Set default directories
@@ -337,10 +688,7 @@ def run_validation(task: str,
         input_memdata_filename = task + "_memdata.txt"
         golden_memdata_filename = "golden_memdata.txt"
         
-        # Save current directory
-        original_dir = os.getcwd()
-        
-        # Get the executable path BEFORE changing directory (to resolve relative paths correctly)
+        # Get the executable path (relative paths are resolved against the current directory)
         exe_path = get_executable_path()
         if not os.path.isabs(exe_path):
             # Convert to absolute path if it's relative
@@ -359,47 +707,51 @@ def run_validation(task: str,
         output(f"Input directory: {input_dir}")
         output(f"Output directory: {output_dir}")
         
-        try:
-            # Change to input directory
-            os.chdir(input_dir)
-            
-            output(f"Starting validation for task: {task}")
-            output(f"Working directory: {os.getcwd()}")
-            
-            # Run golden model first
-            output("\n=== Running Golden Model ===")
-            run_golden_model(
-                os.path.join(task, "golden.py"), 
-                input_memdata_filename, 
-                golden_memdata_filename,
-                stdout_callback=stdout_callback
-            )
-            
-            # Run the simulator
-            output("\n=== Running CGRA Simulator ===")
-            run_simulator(
-                exe_path, 
-                task, 
-                input_memdata_filename,
-                resource_dir=resource_dir,
-                stdout_callback=stdout_callback
-            )
-            
-            # Compare results
-            output("\n=== Comparing Results ===")
-            sim_output_path = os.path.join(output_dir, "memorywrite.txt")
-            result = compare_results(
-                golden_memdata_filename, 
-                sim_output_path, 
-                tolerance=1e-3,
-                stdout_callback=stdout_callback
-            )
-            
-            return result
-            
-        finally:
-            # Always restore original directory
-            os.chdir(original_dir)
+        # Nothing changes the process-wide cwd: files are passed as absolute paths and
+        # child processes get input_dir as their own working directory
+        input_memdata_path = os.path.join(input_dir, input_memdata_filename)
+        golden_memdata_path = os.path.join(input_dir, golden_memdata_filename)
+        
+        output(f"Starting validation for task: {task}")
+        output(f"Working directory: {input_dir}")
+        
+        # Run golden model first
+        _check_cancelled(cancel_event)
+        output("\n=== Running Golden Model ===")
+        run_golden_model(
+            os.path.join(task, "golden.py"), 
+            input_memdata_path, 
+            golden_memdata_path,
+            stdout_callback=stdout_callback,
+            cwd=input_dir,
+            cancel_event=cancel_event
+        )
+        
+        # Run the simulator (task and memdata file are relative to its working directory)
+        _check_cancelled(cancel_event)
+        output("\n=== Running CGRA Simulator ===")
+        run_simulator(
+            exe_path, 
+            task, 
+            input_memdata_filename,
+            resource_dir=resource_dir,
+            stdout_callback=stdout_callback,
+            cwd=input_dir,
+            cancel_event=cancel_event
+        )
+        
+        # Compare results
+        _check_cancelled(cancel_event)
+        output("\n=== Comparing Results ===")
+        sim_output_path = os.path.join(output_dir, "memorywrite.txt")
+        result = compare_results(
+            golden_memdata_path, 
+            sim_output_path, 
+            tolerance=1e-3,
+            stdout_callback=stdout_callback
+        )
+        
+        return result
             
     except Exception as e:
         error_msg = f"Validation error: {str(e)}"
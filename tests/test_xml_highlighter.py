@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the XML syntax highlighter patterns.
+Run from the project root: python -m unittest discover -s tests
+"""
+
+import os
+import sys
+import time
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from PyQt6.QtGui import QGuiApplication, QTextDocument
+from ui.xml_highlighter import XmlSyntaxHighlighter
+
+# Generous upper bound for highlighting the ~1 MB blob; a pattern that backtracks
+# across the whole line takes far longer
+BLOB_SECONDS = 10.0
+
+
+class XmlHighlighterTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QGuiApplication.instance() or QGuiApplication([])
+
+    def setUp(self):
+        self.document = QTextDocument()
+        self.highlighter = XmlSyntaxHighlighter(self.document)
+        formats = self.highlighter.group_formats
+        self.comment_format, self.keyword_format, self.tag_format = formats[1], formats[2], formats[4]
+
+    def _highlight(self, text):
+        """Highlight text; return the time it took."""
+        self.document.setPlainText(text)
+        start = time.perf_counter()
+        self.highlighter.rehighlight()
+        return time.perf_counter() - start
+
+    def _format_at(self, position, block_number=0):
+        """Return the format applied at position of a block (adjacent equal formats are merged)."""
+        for r in self.document.findBlockByNumber(block_number).layout().formats():
+            if r.start <= position < r.start + r.length:
+                return r.format
+        return None
+
+    def test_two_comments_on_one_line_stay_separate(self):
+        self._highlight("<!--a--><x/><!--b-->")
+        self.assertEqual(self._format_at(0), self.comment_format)
+        # "<x/>" between the comments is a tag, not part of one comment spanning both
+        self.assertEqual(self._format_at(8), self.tag_format)
+        self.assertEqual(self._format_at(10), self.tag_format)
+        self.assertEqual(self._format_at(12), self.comment_format)
+
+    def test_megabyte_blob(self):
+        unit = '<!-- c --><x/><![CDATA[ d ]]><y/><?pi a?><z/>'
+        line = unit * 100
+        text = "\n".join([line] * ((1 << 20) // len(line) + 1))
+        self.assertGreaterEqual(len(text), 1 << 20)
+
+        elapsed = self._highlight(text)
+        self.assertLess(elapsed, BLOB_SECONDS)
+
+        # Tags between comments, CDATA sections and PIs keep the tag format on every line
+        for block_number in (0, self.document.blockCount() - 1):
+            for offset in range(0, len(line), len(unit)):
+                self.assertEqual(self._format_at(offset, block_number), self.comment_format)
+                self.assertEqual(self._format_at(offset + unit.index("<x/>"), block_number), self.tag_format)
+                self.assertEqual(self._format_at(offset + unit.index("<![CDATA["), block_number),
+                                 self.keyword_format)
+                self.assertEqual(self._format_at(offset + unit.index("<y/>"), block_number), self.tag_format)
+                self.assertEqual(self._format_at(offset + unit.index("<?pi"), block_number), self.keyword_format)
+                self.assertEqual(self._format_at(offset + unit.index("<z/>"), block_number), self.tag_format)
+
+
+if __name__ == "__main__":
+    unittest.main()